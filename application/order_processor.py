@@ -196,15 +196,16 @@ class OrderProcessor:
         )
         
         if order:
-            # Check low stock and notify suppliers
+            # Check low stock and notify suppliers in one batch
+            reorders = []
             for product_id, _, _ in order_items_tuples:
                 product = self._product_service.get_product(product_id)
                 if product and product.quantity_available < 5:
-                    self._supplier_service.notify_reorder(
-                        product_name=product.name,
-                        supplier_id=product.supplier_id,
-                        current_stock=product.quantity_available
+                    reorders.append(
+                        (product.name, product.supplier_id, product.quantity_available)
                     )
+            if reorders:
+                self._supplier_service.notify_reorders(reorders)
         
         return order
 
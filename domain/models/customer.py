@@ -10,6 +10,17 @@ from domain.enums.membership_tier import MembershipTier
 
 
 class Customer:
+    __slots__ = (
+        '__customer_id',
+        '__name',
+        '__email',
+        '__membership_tier',
+        '__phone',
+        '__address',
+        '__loyalty_points',
+        '__order_history',
+    )
+
     def __init__(
         self,
         customer_id: int,
@@ -8,6 +8,17 @@ from domain.enums.product_category import ProductCategory
 
 
 class Product:
+    __slots__ = (
+        '__product_id',
+        '__name',
+        '__price',
+        '__quantity_available',
+        '__category',
+        '__weight',
+        '__supplier_id',
+        '__discount_eligible',
+    )
+
     def __init__(
         self,
         product_id: int,
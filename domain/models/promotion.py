@@ -9,6 +9,16 @@ from domain.enums.product_category import ProductCategory
 
 
 class Promotion:
+    __slots__ = (
+        '__promo_id',
+        '__code',
+        '__discount_percent',
+        '__min_purchase',
+        '__valid_until',
+        '__category',
+        '__used_count',
+    )
+
     def __init__(
         self,
         promo_id: int,
@@ -1,20 +1,29 @@
 """
 Shipment domain model - tracks package delivery
 """
-from typing import Any
+from typing import Any, Union
 from domain.enums.shipment_status import ShipmentStatus
 from domain.enums.shipping_method import ShippingMethod
 from domain.value_objects.address import Address
 
 
 class Shipment:
+    __slots__ = (
+        '__shipment_id',
+        '__order_id',
+        '__tracking_number',
+        '__shipping_method',
+        '__address',
+        '__status',
+    )
+
     def __init__(
         self,
         shipment_id: int,
         order_id: int,
         tracking_number: str,
         shipping_method: str,
-        address: str,
+        address: Union[str, Address],
         status: str = ShipmentStatus.PENDING
     ) -> None:
         self.__validate(shipment_id, order_id, tracking_number)
@@ -24,7 +33,9 @@ class Shipment:
         self.__tracking_number: str = tracking_number
         self.__shipping_method: ShippingMethod = ShippingMethod(
             shipping_method)
-        self.__address: Address = Address(address)
+        # A prebuilt Address has already been validated
+        self.__address: Address = (
+            address if isinstance(address, Address) else Address(address))
         self.__status: ShipmentStatus = ShipmentStatus(status)
 
     def __validate(self, shipment_id: int, order_id: int, tracking_number: str) -> None:
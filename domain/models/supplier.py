@@ -7,6 +7,14 @@ from domain.value_objects.email import Email
 
 
 class Supplier:
+    __slots__ = (
+        '__supplier_id',
+        '__name',
+        '__email',
+        '__email_address',
+        '__reliability_score',
+    )
+
     def __init__(
         self,
         supplier_id: int,
@@ -19,6 +27,8 @@ class Supplier:
         self.__supplier_id: int = supplier_id
         self.__name: str = name
         self.__email: Email = Email(email)
+        # Resolved once; Email is immutable and has no setter here
+        self.__email_address: str = self.__email.value
         self.__reliability_score: Union[int, float] = reliability_score
 
     def __validate(
@@ -44,6 +54,10 @@ class Supplier:
     def email(self) -> Email:
         return self.__email
 
+    @property
+    def email_address(self) -> str:
+        return self.__email_address
+
     @property
     def reliability_score(self) -> Union[int, float]:
         return self.__reliability_score
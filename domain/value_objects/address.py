@@ -5,6 +5,8 @@ Used in: Customer, for tax rate calculation
 
 
 class Address:
+    __slots__ = ('__address',)
+
     def __init__(self, address: str) -> None:
         self.__validate(address)
         self.__address = address
@@ -5,6 +5,8 @@ Used in: Customer, Supplier
 
 
 class Email:
+    __slots__ = ('__email',)
+
     def __init__(self, email: str) -> None:
         self.__validate(email)
         self.__email = email.strip()
@@ -15,16 +17,9 @@ class Email:
             raise ValueError(f"Invalid email: {email}")
         
         email = email.strip()
-        if '@' not in email:
-            raise ValueError(f"Invalid email: {email}")
-        
-        # Split by @ to check local and domain parts
-        parts = email.split('@')
-        if len(parts) != 2:
-            raise ValueError(f"Invalid email: {email}")
-        
-        local_part, domain_part = parts
-        if not local_part or not domain_part:
+        # A single '@' with non-empty parts on both sides
+        local_part, _, domain_part = email.partition('@')
+        if not local_part or not domain_part or '@' in domain_part:
             raise ValueError(f"Invalid email: {email}")
 
     @property
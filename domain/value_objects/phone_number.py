@@ -4,8 +4,13 @@ Used in: Customer
 """
 from typing import Optional
 
+# Separators ignored when validating the digits of a phone number
+_PHONE_SEPARATORS = str.maketrans('', '', ' -()+')
+
 
 class PhoneNumber:
+    __slots__ = ('__phone',)
+
     def __init__(self, phone: Optional[str]) -> None:
         self.__validate(phone)
         self.__phone = phone
@@ -14,7 +19,7 @@ class PhoneNumber:
         """Validate phone number format"""
         if phone is not None:
             # Remove spaces and common separators for validation
-            cleaned_phone = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '').replace('+', '')
+            cleaned_phone = phone.translate(_PHONE_SEPARATORS)
             if not cleaned_phone.isdigit() or len(cleaned_phone) < 5:
                 raise ValueError(f"Invalid phone number: {phone}")
             if len(cleaned_phone) > 15:  # Max international phone number length
@@ -2,7 +2,7 @@
 In-memory implementation of OrderRepository
 Replaces global 'orders' dictionary and 'next_order_id' counter
 """
-from typing import Optional
+from typing import Iterator, Optional
 from domain.models.order import Order
 
 
@@ -39,6 +39,10 @@ class InMemoryOrderRepository:
         """Get all orders"""
         return self._storage.copy()
 
+    def iter_values(self) -> Iterator[Order]:
+        """Iterate over stored orders without copying the storage"""
+        return iter(self._storage.values())
+
     def exists(self, order_id: int) -> bool:
         """Check if an order exists"""
         return order_id in self._storage
@@ -2,6 +2,9 @@
 In-memory implementation of PromotionRepository
 Replaces global 'promotions' dictionary
 """
+import bisect
+import datetime
+import operator
 from typing import Optional
 from domain.models.promotion import Promotion
 
@@ -12,10 +15,14 @@ class InMemoryPromotionRepository:
     def __init__(self) -> None:
         """Initialize with empty storage"""
         self._storage: dict[str, Promotion] = {}
+        # (valid_until, code) pairs kept sorted for expiry range queries
+        self.__by_expiry: list[tuple[datetime.datetime, str]] = []
 
     def add(self, promotion: Promotion) -> None:
         """Add a new promotion to the repository"""
+        self.__unindex(promotion.code)
         self._storage[promotion.code] = promotion
+        bisect.insort(self.__by_expiry, (promotion.valid_until, promotion.code))
 
     def get(self, promo_code: str) -> Optional[Promotion]:
         """Retrieve a promotion by code"""
@@ -23,11 +30,12 @@ class InMemoryPromotionRepository:
 
     def update(self, promotion: Promotion) -> None:
         """Update an existing promotion"""
-        self._storage[promotion.code] = promotion
+        self.add(promotion)
 
     def delete(self, promo_code: str) -> None:
         """Remove a promotion from the repository"""
         if promo_code in self._storage:
+            self.__unindex(promo_code)
             del self._storage[promo_code]
 
     def get_all(self) -> dict[str, Promotion]:
@@ -37,3 +45,19 @@ class InMemoryPromotionRepository:
     def exists(self, promo_code: str) -> bool:
         """Check if a promotion exists"""
         return promo_code in self._storage
+
+    def find_active(self, moment: datetime.datetime) -> list[Promotion]:
+        """Find promotions still valid after the given moment"""
+        start = bisect.bisect_right(
+            self.__by_expiry, moment, key=operator.itemgetter(0))
+        return [self._storage[code] for _, code in self.__by_expiry[start:]]
+
+    def __unindex(self, promo_code: str) -> None:
+        """Drop the expiry index entry of a stored promotion"""
+        existing = self._storage.get(promo_code)
+        if existing is None:
+            return
+        entry = (existing.valid_until, promo_code)
+        index = bisect.bisect_left(self.__by_expiry, entry)
+        if index < len(self.__by_expiry) and self.__by_expiry[index] == entry:
+            del self.__by_expiry[index]
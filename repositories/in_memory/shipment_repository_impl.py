@@ -11,11 +11,15 @@ class InMemoryShipmentRepository:
 
     def __init__(self) -> None:
         self.__shipments: dict[int, Shipment] = {}
+        # Secondary index: tracking number -> shipment ID
+        self.__by_tracking_number: dict[str, int] = {}
         self.__next_id: int = 1
 
     def add(self, shipment: Shipment) -> None:
         """Add a new shipment"""
+        self.__unindex(shipment.shipment_id)
         self.__shipments[shipment.shipment_id] = shipment
+        self.__by_tracking_number[shipment.tracking_number] = shipment.shipment_id
 
     def get(self, shipment_id: int) -> Optional[Shipment]:
         """Retrieve a shipment by ID"""
@@ -23,11 +27,12 @@ class InMemoryShipmentRepository:
 
     def update(self, shipment: Shipment) -> None:
         """Update an existing shipment"""
-        self.__shipments[shipment.shipment_id] = shipment
+        self.add(shipment)
 
     def delete(self, shipment_id: int) -> None:
         """Remove a shipment"""
         if shipment_id in self.__shipments:
+            self.__unindex(shipment_id)
             del self.__shipments[shipment_id]
 
     def get_all(self) -> List[Shipment]:
@@ -51,7 +56,13 @@ class InMemoryShipmentRepository:
 
     def find_by_tracking_number(self, tracking_number: str) -> Optional[Shipment]:
         """Find shipment by tracking number"""
-        for shipment in self.__shipments.values():
-            if shipment.tracking_number == tracking_number:
-                return shipment
-        return None
+        shipment_id = self.__by_tracking_number.get(tracking_number)
+        if shipment_id is None:
+            return None
+        return self.__shipments.get(shipment_id)
+
+    def __unindex(self, shipment_id: int) -> None:
+        """Drop the tracking number index entry of a stored shipment"""
+        existing = self.__shipments.get(shipment_id)
+        if existing is not None:
+            self.__by_tracking_number.pop(existing.tracking_number, None)
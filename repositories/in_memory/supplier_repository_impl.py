@@ -2,7 +2,10 @@
 In-memory implementation of SupplierRepository
 Replaces global 'suppliers' dictionary
 """
-from typing import Optional
+import bisect
+import operator
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
 from domain.models.supplier import Supplier
 
 
@@ -13,10 +16,19 @@ class InMemorySupplierRepository:
         """Initialize with empty storage"""
         self._storage: dict[int, Supplier] = {
         }
+        # (reliability_score, supplier_id) pairs kept sorted for threshold
+        # queries, plus the score each supplier was indexed under; score
+        # changes must be saved through update() to be re-indexed
+        self.__by_reliability: list[tuple[Union[int, float], int]] = []
+        self.__indexed_scores: dict[int, Union[int, float]] = {}
 
     def add(self, supplier: Supplier) -> None:
         """Add a new supplier to the repository"""
+        self.__unindex(supplier.supplier_id)
         self._storage[supplier.supplier_id] = supplier
+        score = supplier.reliability_score
+        bisect.insort(self.__by_reliability, (score, supplier.supplier_id))
+        self.__indexed_scores[supplier.supplier_id] = score
 
     def get(self, supplier_id: int) -> Optional[Supplier]:
         """Retrieve a supplier by ID"""
@@ -24,17 +36,44 @@ class InMemorySupplierRepository:
 
     def update(self, supplier: Supplier) -> None:
         """Update an existing supplier"""
-        self._storage[supplier.supplier_id] = supplier
+        self.add(supplier)
 
     def delete(self, supplier_id: int) -> None:
         """Remove a supplier from the repository"""
         if supplier_id in self._storage:
+            self.__unindex(supplier_id)
             del self._storage[supplier_id]
 
     def get_all(self) -> dict[int, Supplier]:
         """Get all suppliers"""
         return self._storage.copy()
 
+    def view_all(self) -> Mapping[int, Supplier]:
+        """Get a read-only live view of all suppliers"""
+        return MappingProxyType(self._storage)
+
     def exists(self, supplier_id: int) -> bool:
         """Check if a supplier exists"""
         return supplier_id in self._storage
+
+    def find_by_min_reliability(
+        self,
+        min_reliability: Union[int, float]
+    ) -> list[Supplier]:
+        """Find suppliers whose reliability score is at least the threshold"""
+        start = bisect.bisect_left(
+            self.__by_reliability, min_reliability, key=operator.itemgetter(0))
+        return [
+            self._storage[supplier_id]
+            for _, supplier_id in self.__by_reliability[start:]
+        ]
+
+    def __unindex(self, supplier_id: int) -> None:
+        """Drop the reliability index entry of a stored supplier"""
+        score = self.__indexed_scores.pop(supplier_id, None)
+        if score is None:
+            return
+        entry = (score, supplier_id)
+        index = bisect.bisect_left(self.__by_reliability, entry)
+        if index < len(self.__by_reliability) and self.__by_reliability[index] == entry:
+            del self.__by_reliability[index]
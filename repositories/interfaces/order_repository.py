@@ -1,7 +1,7 @@
 """
 Order Repository Interface - defines contract for order data access
 """
-from typing import Protocol, Optional
+from typing import Iterator, Protocol, Optional
 from domain.models.order import Order
 
 
@@ -28,6 +28,10 @@ class OrderRepository(Protocol):
         """Get all orders"""
         ...
 
+    def iter_values(self) -> Iterator[Order]:
+        """Iterate over stored orders without copying the storage"""
+        ...
+
     def exists(self, order_id: int) -> bool:
         """Check if an order exists"""
         ...
@@ -1,6 +1,7 @@
 """
 Promotion Repository Interface - defines contract for promotion data access
 """
+import datetime
 from typing import Protocol, Optional
 from domain.models.promotion import Promotion
 
@@ -31,3 +32,7 @@ class PromotionRepository(Protocol):
     def exists(self, promo_code: str) -> bool:
         """Check if a promotion exists"""
         ...
+
+    def find_active(self, moment: datetime.datetime) -> list[Promotion]:
+        """Find promotions still valid after the given moment"""
+        ...
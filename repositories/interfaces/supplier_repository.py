@@ -1,7 +1,7 @@
 """
 Supplier Repository Interface - defines contract for supplier data access
 """
-from typing import Protocol, Optional
+from typing import Mapping, Protocol, Optional, Union
 from domain.models.supplier import Supplier
 
 
@@ -28,6 +28,17 @@ class SupplierRepository(Protocol):
         """Get all suppliers"""
         ...
 
+    def view_all(self) -> Mapping[int, Supplier]:
+        """Get a read-only live view of all suppliers"""
+        ...
+
     def exists(self, supplier_id: int) -> bool:
         """Check if a supplier exists"""
         ...
+
+    def find_by_min_reliability(
+        self,
+        min_reliability: Union[int, float]
+    ) -> list[Supplier]:
+        """Find suppliers whose reliability score is at least the threshold"""
+        ...
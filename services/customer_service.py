@@ -80,18 +80,8 @@ class CustomerService:
         if not customer:
             return False
         
-        new_points = customer.loyalty_points + points
-        updated_customer = Customer(
-            customer_id=customer.customer_id,
-            name=customer.name,
-            email=customer.email.value,
-            membership_tier=customer.membership_tier.value,
-            phone=customer.phone.value or "",
-            address=customer.address.value,
-            loyalty_points=new_points,
-            order_history=customer.order_history
-        )
-        self.__repository.update(updated_customer)
+        customer.loyalty_points = customer.loyalty_points + points
+        self.__repository.update(customer)
         return True
 
     def update_loyalty_points(self, customer_id: int, new_points: int) -> bool:
@@ -109,17 +99,8 @@ class CustomerService:
         if not customer:
             return False
         
-        updated_customer = Customer(
-            customer_id=customer.customer_id,
-            name=customer.name,
-            email=customer.email.value,
-            membership_tier=customer.membership_tier.value,
-            phone=customer.phone.value or "",
-            address=customer.address.value,
-            loyalty_points=new_points,
-            order_history=customer.order_history
-        )
-        self.__repository.update(updated_customer)
+        customer.loyalty_points = new_points
+        self.__repository.update(customer)
         return True
 
     def upgrade_membership(
@@ -141,18 +122,8 @@ class CustomerService:
         if not customer:
             return False
 
-        # Create updated customer
-        updated_customer = Customer(
-            customer_id=customer.customer_id,
-            name=customer.name,
-            email=customer.email.value,
-            membership_tier=new_tier,
-            phone=customer.phone.value or "",
-            address=customer.address.value,
-            loyalty_points=customer.loyalty_points,
-            order_history=customer.order_history
-        )
-        self.__repository.update(updated_customer)
+        customer.membership_tier = new_tier
+        self.__repository.update(customer)
         print(f"Customer {customer.name} upgraded to {new_tier}!")
         return True
 
@@ -173,19 +144,7 @@ class CustomerService:
 
         # Add order to history (customer has order_history list)
         customer.order_history.append(order_id)
-        
-        # Create updated customer and save back to repository
-        updated_customer = Customer(
-            customer_id=customer.customer_id,
-            name=customer.name,
-            email=customer.email.value,
-            membership_tier=customer.membership_tier,
-            phone=customer.phone.value if customer.phone.value is not None else "",
-            address=customer.address.value,
-            loyalty_points=customer.loyalty_points,
-            order_history=customer.order_history
-        )
-        self.__repository.update(updated_customer)
+        self.__repository.update(customer)
         return True
 
     def get_all_customers(self) -> dict[int, Customer]:
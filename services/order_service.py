@@ -1,6 +1,6 @@
 """Order Service - Handles order creation and management."""
 
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Iterator, Optional, TYPE_CHECKING
 import datetime
 from domain.models.order import Order
 from domain.models.order_item import OrderItem
@@ -60,6 +60,11 @@ class OrderService:
         self.__inventory_service = inventory_service
         self.__supplier_service = supplier_service
         self.__promotion_service = promotion_service
+        # Running product_id -> quantity sold over non-cancelled orders,
+        # built from the repository on first read (see get_quantities_sold)
+        self.__quantity_sold: Optional[dict[int, int]] = None
+        # Bumped on every order write so readers can invalidate caches
+        self.__version = 0
 
     def create_order(
         self,
@@ -192,6 +197,8 @@ class OrderService:
         )
 
         self.__repository.add(order)
+        self.__version += 1
+        self.__track_quantity_sold(order, 1)
 
 
         self.__customer_service.add_order_to_history(customer_id, order_id)
@@ -271,6 +278,8 @@ class OrderService:
         
         order.status = OrderStatus.CANCELLED
         self.__repository.update(order)
+        self.__version += 1
+        self.__track_quantity_sold(order, -1)
         
         customer = self.__customer_service.get_customer(order.customer_id)
         if customer:
@@ -332,6 +341,62 @@ class OrderService:
         """Get all orders."""
         return self.__repository.get_all()
 
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever an order is created or modified."""
+        return self.__version
+
+    def iter_orders(self) -> Iterator[Order]:
+        """
+        Iterate over all orders without copying the order storage.
+
+        Returns:
+            Iterator over stored orders
+        """
+        return self.__repository.iter_values()
+
+    def get_quantities_sold(self) -> dict[int, int]:
+        """
+        Get quantities sold per product across non-cancelled orders.
+
+        The first call scans the repository, so orders it already held
+        (e.g. an injected, pre-populated repository) are counted. After that
+        the totals are maintained incrementally as orders are created,
+        cancelled or change status through this service, so reading them
+        does not rescan the order history. Orders written to the repository
+        directly after the first call are not picked up.
+
+        Returns:
+            Dictionary of product_id -> total quantity sold
+        """
+        if self.__quantity_sold is None:
+            self.__quantity_sold = {}
+            cancelled = OrderStatus.CANCELLED
+            for order in self.__repository.iter_values():
+                if order.status != cancelled:
+                    self.__track_quantity_sold(order, 1)
+        return self.__quantity_sold.copy()
+
+    def __track_quantity_sold(self, order: Order, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) an order's items from the running
+        quantities sold.
+
+        Args:
+            order: Order whose items are applied
+            sign: 1 to count the order, -1 to uncount it
+        """
+        quantity_sold = self.__quantity_sold
+        if quantity_sold is None:
+            # Not built yet; the first read scans the repository instead
+            return
+        for item in order.items:
+            quantity = quantity_sold.get(item.product_id, 0) + sign * item.quantity
+            if quantity:
+                quantity_sold[item.product_id] = quantity
+            else:
+                quantity_sold.pop(item.product_id, None)
+
     def update_order_status(
         self,
         order_id: int,
@@ -351,8 +416,14 @@ class OrderService:
         if not order:
             return None
 
+        was_cancelled = order.status == OrderStatus.CANCELLED
         order.status = new_status
         self.__repository.update(order)
+        self.__version += 1
+
+        is_cancelled = new_status == OrderStatus.CANCELLED
+        if was_cancelled != is_cancelled:
+            self.__track_quantity_sold(order, -1 if is_cancelled else 1)
 
         customer = self.__customer_service.get_customer(order.customer_id)
         if customer:
@@ -363,6 +434,7 @@ class OrderService:
             if tracking_number:
                 order.tracking_number = tracking_number
                 self.__repository.update(order)
+                self.__version += 1
 
         return order
 
@@ -401,6 +473,7 @@ class OrderService:
 
         order.total_price = new_price  # Setter expects int|float, not Money
         self.__repository.update(order)
+        self.__version += 1
 
         print(
             f"Applied {discount_percent}% discount to order {order_id}. Reason: {reason}")
@@ -1,9 +1,12 @@
 """Product Service - Manages product operations."""
 
+import logging
 from typing import Optional
 from domain.models.product import Product
 from repositories.interfaces.product_repository import ProductRepository
 
+logger = logging.getLogger(__name__)
+
 
 class ProductService:
     """Service for product management operations."""
@@ -52,7 +55,6 @@ class ProductService:
             supplier_id=supplier_id
         )
         self.__repository.add(product)
-        # Note: Repository uses string keys internally, conversion handled by repository
         return product
 
     def get_product(self, product_id: int) -> Optional[Product]:
@@ -94,8 +96,12 @@ class ProductService:
             supplier_id=product.supplier_id
         )
         self.__repository.update(updated_product)
-        print(
-            f"Updated {product.name} price from ${old_price:.2f} to ${new_price:.2f}")
+        # Guarded so bulk price updates skip formatting when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Updated %s price from $%.2f to $%.2f",
+                product.name, old_price.value, new_price
+            )
         return True
 
     def get_all_products(self) -> dict[int, Product]:
@@ -2,6 +2,7 @@
 
 from typing import Optional
 import datetime
+import time
 from domain.models.promotion import Promotion
 from repositories.interfaces.promotion_repository import PromotionRepository
 
@@ -9,6 +10,9 @@ from repositories.interfaces.promotion_repository import PromotionRepository
 class PromotionService:
     """Service for promotion and discount code management."""
 
+    # Seconds a wall-clock reading is reused for expiration checks
+    CLOCK_TTL = 0.5
+
     def __init__(self, promotion_repository: PromotionRepository) -> None:
         """
         Initialize the promotion service.
@@ -17,6 +21,9 @@ class PromotionService:
             promotion_repository: Repository for promotion data access (DI)
         """
         self.__repository = promotion_repository
+        # Force a clock read on first use
+        self.__now_cached = datetime.datetime.min
+        self.__now_cached_at = float('-inf')
 
     def add_promotion(
         self,
@@ -65,7 +72,7 @@ class PromotionService:
         promotion = self.__repository.get(code)
 
         # Check if promotion is still valid
-        if promotion and datetime.datetime.now() > promotion.valid_until:
+        if promotion and self.__now() > promotion.valid_until:
             return None
 
         return promotion
@@ -93,11 +100,7 @@ class PromotionService:
         Returns:
             List of active promotions
         """
-        now = datetime.datetime.now()
-        return [
-            promo for promo in self.__repository.get_all().values()
-            if promo.valid_until > now
-        ]
+        return self.__repository.find_active(self.__now())
 
     def get_all_promotions(self) -> dict[str, Promotion]:
         """
@@ -107,3 +110,16 @@ class PromotionService:
             Dictionary of all promotions
         """
         return self.__repository.get_all()
+
+    def __now(self) -> datetime.datetime:
+        """
+        Get the current time, refreshed at most once per CLOCK_TTL.
+
+        Returns:
+            Cached wall-clock time used for expiration checks
+        """
+        monotonic_now = time.monotonic()
+        if monotonic_now - self.__now_cached_at > self.CLOCK_TTL:
+            self.__now_cached = datetime.datetime.now()
+            self.__now_cached_at = monotonic_now
+        return self.__now_cached
@@ -1,16 +1,31 @@
 """Reporting Service - Handles sales reports and analytics."""
 
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from typing import Iterable, NamedTuple, Optional, TYPE_CHECKING
 import datetime
+import heapq
+import operator
 from domain.enums.order_status import OrderStatus
 from domain.value_objects.sales_report import SalesReport
 
 if TYPE_CHECKING:
+    from domain.models.order import Order
+    from domain.models.product import Product
     from services.customer_service import CustomerService
     from services.order_service import OrderService
     from services.product_service import ProductService
 
 
+class _OrderAggregates(NamedTuple):
+    """Metrics collected by a single pass over a set of orders."""
+
+    total_sales: float
+    total_orders: int
+    cancelled_orders: int
+    products_sold: dict[int, int]
+    revenue_by_category: dict[str, float]
+
+
 class ReportingService:
     """Service for generating reports and analytics."""
 
@@ -24,6 +39,10 @@ class ReportingService:
         self.__customer_service = customer_service
         self.__order_service = order_service
         self.__product_service = product_service
+        # customer_id -> (order history it was computed from, lifetime value),
+        # valid for one order service version
+        self.__lifetime_values: dict[int, tuple[tuple[int, ...], float]] = {}
+        self.__lifetime_values_version: Optional[int] = None
 
     def get_customer_lifetime_value(self, customer_id: int) -> float:
         """
@@ -39,12 +58,40 @@ class ReportingService:
         if not customer:
             return 0.0
 
+        # Reuse a result while the order service version and the customer's
+        # order history both match what it was computed from; the history
+        # can change without an order write (add_order_to_history)
+        version = self.__order_service.version
+        if version != self.__lifetime_values_version:
+            self.__lifetime_values.clear()
+            self.__lifetime_values_version = version
+
+        order_history = tuple(customer.order_history)
+        cached = self.__lifetime_values.get(customer_id)
+        if cached is not None and cached[0] == order_history:
+            return cached[1]
+
+        total_value = self.__compute_lifetime_value(order_history)
+        self.__lifetime_values[customer_id] = (order_history, total_value)
+        return total_value
+
+    def __compute_lifetime_value(self, order_history: Iterable[int]) -> float:
+        """
+        Sum the non-cancelled orders in a customer's order history.
+
+        Args:
+            order_history: Order IDs from the customer's history
+
+        Returns:
+            Total value of all non-cancelled orders
+        """
         total_value = 0.0
-        orders = self.__order_service.get_all_orders()
+        get_order = self.__order_service.get_order
+        cancelled = OrderStatus.CANCELLED
 
-        for order_id in customer.order_history:
-            order = orders.get(order_id)
-            if order and order.status != OrderStatus.CANCELLED:
+        for order_id in order_history:
+            order = get_order(order_id)
+            if order and order.status != cancelled:
                 total_value += order.total_price.value
 
         return total_value
@@ -64,54 +111,24 @@ class ReportingService:
         Returns:
             SalesReport value object with sales metrics
         """
-        # Initialize metrics
-        total_sales = 0.0
-        total_orders = 0
-        cancelled_orders = 0
-        products_sold: dict[int, int] = {}
-        revenue_by_category: dict[str, float] = {}
-
-        orders = self.__order_service.get_all_orders()
         products = self.__product_service.get_all_products()
 
-        # Process all orders in date range
-        for order in orders.values():
-            if start_date <= order.created_at <= end_date:
-                if order.status != OrderStatus.CANCELLED:
-                    total_sales += order.total_price.value
-                    total_orders += 1
-
-                    # Aggregate products sold
-                    for item in order.items:
-                        product = products.get(item.product_id)
-                        if product:
-                            # Count products sold
-                            if product.product_id not in products_sold:
-                                products_sold[product.product_id] = 0
-                            products_sold[product.product_id] += item.quantity
-
-                            # Revenue by category
-                            if product.category not in revenue_by_category:
-                                revenue_by_category[product.category] = 0.0
-
-                            # Extract Money value
-                            item_price = item.unit_price.value
-                            revenue_by_category[product.category] += (
-                                item.quantity * item_price
-                            )
-                else:
-                    cancelled_orders += 1
+        in_range = (
+            order for order in self.__order_service.iter_orders()
+            if start_date <= order.created_at <= end_date
+        )
+        aggregates = self.__aggregate_orders(in_range, products)
 
         # Calculate top customers
         top_customers = self.__get_top_customers(limit=10)
 
         # Return SalesReport value object
         return SalesReport(
-            total_sales=total_sales,
-            total_orders=total_orders,
-            cancelled_orders=cancelled_orders,
-            products_sold=products_sold,
-            revenue_by_category=revenue_by_category,
+            total_sales=aggregates.total_sales,
+            total_orders=aggregates.total_orders,
+            cancelled_orders=aggregates.cancelled_orders,
+            products_sold=aggregates.products_sold,
+            revenue_by_category=aggregates.revenue_by_category,
             top_customers=top_customers
         )
 
@@ -132,14 +149,13 @@ class ReportingService:
             customer_spending[customer_id] = self.get_customer_lifetime_value(
                 customer_id)
 
-        sorted_customers = sorted(
+        # Only the top `limit` entries are needed, so avoid a full sort
+        return heapq.nlargest(
+            limit,
             customer_spending.items(),
-            key=lambda x: x[1],
-            reverse=True
+            key=operator.itemgetter(1)
         )
 
-        return sorted_customers[:limit]
-
     def get_product_performance(self) -> dict[int, int]:
         """
         Get product sales performance.
@@ -147,17 +163,7 @@ class ReportingService:
         Returns:
             Dictionary of product_id -> total_quantity_sold
         """
-        products_sold = {}
-        orders = self.__order_service.get_all_orders()
-
-        for order in orders.values():
-            if order.status != OrderStatus.CANCELLED:
-                for item in order.items:
-                    if item.product_id not in products_sold:
-                        products_sold[item.product_id] = 0
-                    products_sold[item.product_id] += item.quantity
-
-        return products_sold
+        return self.__order_service.get_quantities_sold()
 
     def get_category_revenue(self) -> dict[str, float]:
         """
@@ -166,22 +172,59 @@ class ReportingService:
         Returns:
             Dictionary of category -> total_revenue
         """
-        revenue_by_category: dict[str, float] = {}
-        orders = self.__order_service.get_all_orders()
         products = self.__product_service.get_all_products()
+        return self.__aggregate_orders(
+            self.__order_service.iter_orders(), products).revenue_by_category
+
+    def __aggregate_orders(
+        self,
+        orders: Iterable['Order'],
+        products: dict[int, 'Product']
+    ) -> _OrderAggregates:
+        """
+        Aggregate order metrics in a single pass over orders and their items.
+
+        Args:
+            orders: Orders to aggregate
+            products: Product catalog; only catalog products are counted
 
-        for order in orders.values():
-            if order.status != OrderStatus.CANCELLED:
-                for item in order.items:
-                    product = products.get(item.product_id)
-                    if product:
-                        category_key = product.category
-                        if category_key not in revenue_by_category:
-                            revenue_by_category[category_key] = 0.0
-
-                        item_price = item.unit_price.value
-                        revenue_by_category[category_key] += (
-                            item.quantity * item_price
-                        )
-
-        return revenue_by_category
+        Returns:
+            _OrderAggregates with totals, quantities and category revenue
+        """
+        total_sales = 0.0
+        total_orders = 0
+        cancelled_orders = 0
+        products_sold: defaultdict[int, int] = defaultdict(int)
+        revenue_by_category: defaultdict[str, float] = defaultdict(float)
+
+        # Bind loop-invariant lookups once instead of per iteration
+        cancelled = OrderStatus.CANCELLED
+        get_product = products.get
+
+        for order in orders:
+            if order.status == cancelled:
+                cancelled_orders += 1
+                continue
+
+            total_sales += order.total_price.value
+            total_orders += 1
+
+            for item in order.items:
+                product_id = item.product_id
+                product = get_product(product_id)
+                if not product:
+                    continue
+
+                quantity = item.quantity
+                products_sold[product_id] += quantity
+                revenue_by_category[product.category] += (
+                    quantity * item.unit_price.value
+                )
+
+        return _OrderAggregates(
+            total_sales=total_sales,
+            total_orders=total_orders,
+            cancelled_orders=cancelled_orders,
+            products_sold=dict(products_sold),
+            revenue_by_category=dict(revenue_by_category)
+        )
@@ -1,11 +1,17 @@
 """Shipment Service - Handles shipment lifecycle and tracking."""
 
+import itertools
+import os
 from typing import Optional, List
 from domain.enums.shipping_method import ShippingMethod
 from domain.enums.shipment_status import ShipmentStatus
 from domain.models.shipment import Shipment
 from repositories.interfaces.shipment_repository import ShipmentRepository
-import random
+
+# Tracking number suffix: process tag + per-process sequence, unique within
+# a process (unlike a random 4-digit suffix, which collides under load)
+_TRACKING_PROCESS_TAG = os.getpid() & 0xFFFF
+_tracking_sequence = itertools.count()
 
 class ShipmentService:
     """Service for shipment management operations."""
@@ -37,7 +43,10 @@ class ShipmentService:
             Tracking number
         """
         shipment_id = self.__repository.get_next_id()
-        tracking_number = f"TRACK{order_id}{random.randint(1000, 9999)}"
+        tracking_number = (
+            f"TRACK{order_id}"
+            f"{_TRACKING_PROCESS_TAG:04x}{next(_tracking_sequence):08x}"
+        )
 
         shipment = Shipment(
             shipment_id=shipment_id,
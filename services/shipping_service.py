@@ -1,8 +1,61 @@
 """Shipping Service - Handles shipping calculations and logistics."""
 
+from typing import Callable, Final, Sequence
 from domain.enums.shipping_method import ShippingMethod
 from domain.enums.membership_tier import MembershipTier
 
+EXPRESS_BASE: Final = 25.0
+EXPRESS_PER_KG: Final = 0.5
+# Gold members get 50% off express, folded into the rates up front
+EXPRESS_BASE_GOLD: Final = EXPRESS_BASE * 0.5
+EXPRESS_PER_KG_GOLD: Final = EXPRESS_PER_KG * 0.5
+STANDARD_BASE: Final = 5.0
+STANDARD_PER_KG: Final = 0.2
+FREE_SHIP_THRESHOLD: Final = 50.0
+OVERNIGHT_BASE: Final = 50.0
+OVERNIGHT_PER_KG: Final = 1.0
+
+
+def _express_cost(
+    total_weight: float,
+    subtotal: float,
+    customer_tier: MembershipTier
+) -> float:
+    """Express shipping: base fee plus weight, Gold members get 50% off."""
+    if customer_tier == MembershipTier.GOLD:
+        return EXPRESS_BASE_GOLD + total_weight * EXPRESS_PER_KG_GOLD
+    return EXPRESS_BASE + total_weight * EXPRESS_PER_KG
+
+
+def _standard_cost(
+    total_weight: float,
+    subtotal: float,
+    customer_tier: MembershipTier
+) -> float:
+    """Standard shipping: free over $50, otherwise base fee plus weight."""
+    if subtotal < FREE_SHIP_THRESHOLD:
+        return STANDARD_BASE + total_weight * STANDARD_PER_KG
+    return 0.0
+
+
+def _overnight_cost(
+    total_weight: float,
+    subtotal: float,
+    customer_tier: MembershipTier
+) -> float:
+    """Overnight shipping: base fee plus weight."""
+    return OVERNIGHT_BASE + total_weight * OVERNIGHT_PER_KG
+
+
+# Shipping method -> cost formula(total_weight, subtotal, customer_tier)
+_SHIPPING_COST_FORMULAS: dict[
+    ShippingMethod, Callable[[float, float, MembershipTier], float]
+] = {
+    ShippingMethod.EXPRESS: _express_cost,
+    ShippingMethod.STANDARD: _standard_cost,
+    ShippingMethod.OVERNIGHT: _overnight_cost,
+}
+
 
 class ShippingService:
     """Service for shipping cost calculations and delivery estimates."""
@@ -26,21 +79,44 @@ class ShippingService:
         Returns:
             Shipping cost
         """
-        shipping_cost = 0.0
+        formula = _SHIPPING_COST_FORMULAS.get(shipping_method)
+        if formula is None:
+            return 0.0
+        return formula(total_weight, subtotal, customer_tier)
 
-        if shipping_method == ShippingMethod.EXPRESS:
-            shipping_cost = 25 + (total_weight * 0.5)
-            # Gold members get 50% off express shipping
-            if customer_tier == MembershipTier.GOLD:
-                shipping_cost *= 0.5
+    def calculate_shipping_cost_batch(
+        self,
+        shipping_methods: Sequence[ShippingMethod],
+        total_weights: Sequence[float],
+        subtotals: Sequence[float],
+        customer_tiers: Sequence[MembershipTier]
+    ) -> list[float]:
+        """
+        Calculate shipping costs for many orders at once.
 
-        elif shipping_method == ShippingMethod.STANDARD:
-            if subtotal < 50:
-                shipping_cost = 5 + (total_weight * 0.2)
-            else:
-                shipping_cost = 0  # Free shipping over $50
+        Takes parallel sequences (one entry per order) so callers quoting a
+        whole batch avoid a method call per order.
 
-        elif shipping_method == ShippingMethod.OVERNIGHT:
-            shipping_cost = 50 + (total_weight * 1.0)
+        Args:
+            shipping_methods: Selected shipping method per order
+            total_weights: Total package weight in kg per order
+            subtotals: Order subtotal per order
+            customer_tiers: Customer's membership tier per order
 
-        return shipping_cost
+        Returns:
+            Shipping cost per order, in input order
+
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        get_formula = _SHIPPING_COST_FORMULAS.get
+        return [
+            formula(weight, subtotal, tier) if formula is not None else 0.0
+            for formula, weight, subtotal, tier in zip(
+                map(get_formula, shipping_methods),
+                total_weights,
+                subtotals,
+                customer_tiers,
+                strict=True
+            )
+        ]
@@ -1,6 +1,7 @@
 """Supplier Service - Manages supplier operations."""
 
-from typing import Optional
+import sys
+from typing import Iterable, Mapping, Optional
 from domain.models.supplier import Supplier
 from repositories.interfaces.supplier_repository import SupplierRepository
 
@@ -67,10 +68,7 @@ class SupplierService:
         Returns:
             List of reliable suppliers
         """
-        return [
-            supplier for supplier in self.__repository.get_all().values()
-            if supplier.reliability_score >= min_reliability
-        ]
+        return self.__repository.find_by_min_reliability(min_reliability)
 
     def update_supplier_reliability(
         self,
@@ -106,16 +104,27 @@ class SupplierService:
         supplier = self.__repository.get(supplier_id)
         if supplier:
             # Match legacy system: simple print notification
-            print(f"Email to {supplier.email}: Low stock alert for product {product_id}")
+            print(f"Email to {supplier.email_address}: Low stock alert for product {product_id}")
 
     def list_all_suppliers(self) -> list[Supplier]:
         """Get all suppliers."""
-        suppliers_dict = self.__repository.get_all()
-        return list(suppliers_dict.values())
+        return list(self.__repository.view_all().values())
 
-    def get_all_suppliers(self) -> dict[int, Supplier]:
+    def get_all_suppliers(self) -> Mapping[int, Supplier]:
         """
-        Get all suppliers.
+        Get all suppliers as a read-only view.
+
+        The view reflects later repository changes; use
+        snapshot_suppliers() when an independent copy is needed.
+
+        Returns:
+            Read-only mapping of supplier_id -> Supplier
+        """
+        return self.__repository.view_all()
+
+    def snapshot_suppliers(self) -> dict[int, Supplier]:
+        """
+        Get an independent copy of all suppliers.
 
         Returns:
             Dictionary of all suppliers
@@ -143,6 +152,44 @@ class SupplierService:
         if not supplier:
             return False
 
-        message = f"Low stock alert for {product_name}. Current stock: {current_stock}. Please prepare reorder."
-        print(f"[EMAIL to {supplier.email.value}] {message}")
+        print(self.__reorder_message(supplier, product_name, current_stock))
         return True
+
+    def notify_reorders(self, items: Iterable[tuple[str, int, int]]) -> int:
+        """
+        Notify suppliers about several low-stock products at once.
+
+        All messages are written to stdout in a single write, instead of
+        one print per notification.
+
+        Args:
+            items: (product_name, supplier_id, current_stock) tuples
+
+        Returns:
+            Number of notifications sent; unknown suppliers are skipped
+        """
+        get_supplier = self.__repository.get
+        messages = []
+        for product_name, supplier_id, current_stock in items:
+            supplier = get_supplier(supplier_id)
+            if supplier:
+                messages.append(
+                    self.__reorder_message(supplier, product_name, current_stock)
+                )
+
+        if messages:
+            sys.stdout.write("\n".join(messages) + "\n")
+            sys.stdout.flush()
+        return len(messages)
+
+    @staticmethod
+    def __reorder_message(
+        supplier: Supplier,
+        product_name: str,
+        current_stock: int
+    ) -> str:
+        """Format the low stock email sent to a supplier"""
+        return (
+            f"[EMAIL to {supplier.email_address}] Low stock alert for {product_name}. "
+            f"Current stock: {current_stock}. Please prepare reorder."
+        )
@@ -0,0 +1,7 @@
+"""
+Shared clock reading for tests that need deterministic timestamps
+"""
+import datetime
+
+# Explicit timestamp so that objects built with the same fields compare equal
+FIXED_DATETIME = datetime.datetime(2024, 1, 15, 10, 30, 0)
@@ -18,9 +18,10 @@ class TestAddress(unittest.TestCase):
         ]
         
         for addr_str in valid_addresses:
-            address = Address(addr_str)
-            self.assertEqual(address.value, addr_str)
-            self.assertEqual(str(address), addr_str)
+            with self.subTest(address=addr_str):
+                address = Address(addr_str)
+                self.assertEqual(address.value, addr_str)
+                self.assertEqual(str(address), addr_str)
 
     def test_address_creation_invalid(self) -> None:
         """Test creating Address with invalid values."""
@@ -32,8 +33,9 @@ class TestAddress(unittest.TestCase):
         ]
         
         for addr_str in invalid_addresses:
-            with self.assertRaises(ValueError):
-                Address(addr_str)
+            with self.subTest(address=addr_str):
+                with self.assertRaises(ValueError):
+                    Address(addr_str)
 
     def test_address_contains_state(self) -> None:
         """Test Address contains method for state codes."""
@@ -2,17 +2,28 @@
 Test Customer domain model - validation and business rules
 Tests the refactored Customer class business logic
 """
+from typing import ClassVar
 import unittest
 from domain.models.customer import Customer
 from domain.enums.membership_tier import MembershipTier
 
+# (name, email, loyalty_points) rows with exactly one invalid field
+_INVALID_CUSTOMER_CASES: tuple[tuple[str, str, int], ...] = (
+    ("John Doe", "invalid-email", 100),  # Invalid email format
+    ("", "john@example.com", 100),  # Invalid empty name
+    ("John Doe", "john@example.com", -10),  # Invalid negative loyalty points
+)
+
 
 class TestCustomer(unittest.TestCase):
     """Test Customer domain model validation and business rules."""
 
-    def test_customer_creation_valid(self) -> None:
-        """Test creating Customer with valid data."""
-        customer = Customer(
+    valid_customer: ClassVar[Customer]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build one valid customer shared by read-only tests."""
+        cls.valid_customer = Customer(
             customer_id=123,
             name="John Doe",
             email="john@example.com",
@@ -21,6 +32,10 @@ class TestCustomer(unittest.TestCase):
             address="123 Main St",
             loyalty_points=100
         )
+
+    def test_customer_creation_valid(self) -> None:
+        """Test creating Customer with valid data."""
+        customer = self.valid_customer
         
         self.assertEqual(customer.customer_id, 123)
         self.assertEqual(customer.name, "John Doe")
@@ -30,44 +45,20 @@ class TestCustomer(unittest.TestCase):
         self.assertEqual(customer.address.value, "123 Main St")
         self.assertEqual(customer.loyalty_points, 100)
 
-    def test_customer_validation_invalid_email(self) -> None:
-        """Test Customer validation - should reject invalid email."""
-        with self.assertRaises(ValueError):
-            Customer(
-                customer_id=123,
-                name="John Doe",
-                email="invalid-email",  # Invalid email format
-                membership_tier=MembershipTier.GOLD,
-                phone="555-0123",
-                address="123 Main St",
-                loyalty_points=100
-            )
-
-    def test_customer_validation_empty_name(self) -> None:
-        """Test Customer validation - should reject empty name."""
-        with self.assertRaises(ValueError):
-            Customer(
-                customer_id=123,
-                name="",  # Invalid empty name
-                email="john@example.com",
-                membership_tier=MembershipTier.GOLD,
-                phone="555-0123",
-                address="123 Main St",
-                loyalty_points=100
-            )
-
-    def test_customer_validation_negative_loyalty_points(self) -> None:
-        """Test Customer validation - should reject negative loyalty points."""
-        with self.assertRaises(ValueError):
-            Customer(
-                customer_id=123,
-                name="John Doe",
-                email="john@example.com",
-                membership_tier=MembershipTier.GOLD,
-                phone="555-0123",
-                address="123 Main St",
-                loyalty_points=-10  # Invalid negative loyalty points
-            )
+    def test_customer_validation_invalid_fields(self) -> None:
+        """Test Customer validation - should reject each invalid field."""
+        for name, email, loyalty_points in _INVALID_CUSTOMER_CASES:
+            with self.subTest(name=name, email=email, loyalty_points=loyalty_points):
+                with self.assertRaises(ValueError):
+                    Customer(
+                        customer_id=123,
+                        name=name,
+                        email=email,
+                        membership_tier=MembershipTier.GOLD,
+                        phone="555-0123",
+                        address="123 Main St",
+                        loyalty_points=loyalty_points
+                    )
 
     def test_customer_validation_invalid_membership_tier(self) -> None:
         """Test Customer validation - should reject invalid membership tier."""
@@ -124,15 +115,7 @@ class TestCustomer(unittest.TestCase):
 
     def test_customer_object_attributes(self) -> None:
         """Test Customer object creation and attributes."""
-        customer = Customer(
-            customer_id=123,
-            name="John Doe",
-            email="john@example.com",
-            membership_tier=MembershipTier.GOLD,
-            phone="555-0123",
-            address="123 Main St",
-            loyalty_points=100
-        )
+        customer = self.valid_customer
         
         # Test object attributes
         self.assertEqual(customer.name, "John Doe")
@@ -18,9 +18,10 @@ class TestEmail(unittest.TestCase):
         ]
         
         for email_str in valid_emails:
-            email = Email(email_str)
-            self.assertEqual(email.value, email_str)
-            self.assertEqual(str(email), email_str)
+            with self.subTest(email=email_str):
+                email = Email(email_str)
+                self.assertEqual(email.value, email_str)
+                self.assertEqual(str(email), email_str)
 
     def test_email_creation_invalid(self) -> None:
         """Test creating Email with invalid formats."""
@@ -33,8 +34,9 @@ class TestEmail(unittest.TestCase):
         ]
         
         for email_str in invalid_emails:
-            with self.assertRaises(ValueError):
-                Email(email_str)
+            with self.subTest(email=email_str):
+                with self.assertRaises(ValueError):
+                    Email(email_str)
 
     def test_email_equality(self) -> None:
         """Test Email equality comparison."""
@@ -3,22 +3,45 @@ Test cases for InventoryLogEntry value object.
 Tests immutability, validation, and all public methods.
 """
 import unittest
-import unittest.mock
 import datetime
-from typing import Any
-from unittest.mock import patch
+from typing import Any, ClassVar
 from domain.value_objects.inventory_log_entry import InventoryLogEntry
+from tests.clock import FIXED_DATETIME
+
+# Validation messages raised by InventoryLogEntry
+INVALID_PRODUCT_ID_MESSAGE = "Product ID must be a positive integer"
+INVALID_REASON_MESSAGE = "Reason must be a non-empty string"
 
 
 class TestInventoryLogEntry(unittest.TestCase):
     """Test cases for InventoryLogEntry value object."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.valid_product_id = 1
-        self.valid_quantity_change = 10
-        self.valid_reason = "restock"
-        self.fixed_datetime = datetime.datetime(2024, 1, 15, 10, 30, 0)
+    valid_product_id: ClassVar[int]
+    valid_quantity_change: ClassVar[int]
+    valid_reason: ClassVar[str]
+    base_entry: ClassVar[InventoryLogEntry]
+    zero_entry: ClassVar[InventoryLogEntry]
+    negative_entry: ClassVar[InventoryLogEntry]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up shared test fixtures.
+
+        InventoryLogEntry is immutable, so read-only tests share these
+        entries instead of constructing their own.
+        """
+        cls.valid_product_id = 1
+        cls.valid_quantity_change = 10
+        cls.valid_reason = "restock"
+
+        cls.base_entry = InventoryLogEntry(
+            product_id=cls.valid_product_id,
+            quantity_change=cls.valid_quantity_change,
+            reason=cls.valid_reason,
+            timestamp=FIXED_DATETIME
+        )
+        cls.zero_entry = InventoryLogEntry(1, 0, "adjustment", FIXED_DATETIME)
+        cls.negative_entry = InventoryLogEntry(1, -5, "sale", FIXED_DATETIME)
 
     def test_valid_inventory_log_entry_creation(self) -> None:
         """Test creation of valid inventory log entry."""
@@ -35,52 +58,36 @@ class TestInventoryLogEntry(unittest.TestCase):
 
     def test_inventory_log_entry_with_custom_timestamp(self) -> None:
         """Test creation with custom timestamp."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-
         entry = InventoryLogEntry(
             product_id=self.valid_product_id,
             quantity_change=self.valid_quantity_change,
             reason=self.valid_reason,
-            timestamp=custom_time
+            timestamp=FIXED_DATETIME
         )
 
-        self.assertEqual(entry.timestamp, custom_time)
+        self.assertEqual(entry.timestamp, FIXED_DATETIME)
 
-    @patch('datetime.datetime')
-    def test_inventory_log_entry_default_timestamp(self, mock_datetime: unittest.mock.MagicMock) -> None:
+    def test_inventory_log_entry_default_timestamp(self) -> None:
         """Test that timestamp defaults to current time when not provided."""
-        mock_datetime.now.return_value = self.fixed_datetime
-        mock_datetime.side_effect = datetime.datetime
-
+        before = datetime.datetime.now()
         entry = InventoryLogEntry(
             product_id=self.valid_product_id,
             quantity_change=self.valid_quantity_change,
             reason=self.valid_reason
         )
+        after = datetime.datetime.now()
 
-        mock_datetime.now.assert_called_once()
-        self.assertEqual(entry.timestamp, self.fixed_datetime)
+        self.assertLessEqual(before, entry.timestamp)
+        self.assertLessEqual(entry.timestamp, after)
 
     def test_invalid_product_id_validation(self) -> None:
         """Test validation for invalid product IDs."""
-        # Test each invalid case separately to avoid type checker issues
-        with self.assertRaises(ValueError) as context:
-            InventoryLogEntry(
-                product_id=0, quantity_change=self.valid_quantity_change, reason=self.valid_reason)
-        self.assertIn("Product ID must be a positive integer",
-                      str(context.exception))
-
-        with self.assertRaises(ValueError) as context:
-            InventoryLogEntry(
-                product_id=-1, quantity_change=self.valid_quantity_change, reason=self.valid_reason)
-        self.assertIn("Product ID must be a positive integer",
-                      str(context.exception))
-
-        with self.assertRaises(ValueError) as context:
-            InventoryLogEntry(
-                product_id=-100, quantity_change=self.valid_quantity_change, reason=self.valid_reason)
-        self.assertIn("Product ID must be a positive integer",
-                      str(context.exception))
+        for product_id in (0, -1, -100):
+            with self.subTest(product_id=product_id):
+                with self.assertRaises(ValueError) as context:
+                    InventoryLogEntry(
+                        product_id=product_id, quantity_change=self.valid_quantity_change, reason=self.valid_reason)
+                self.assertIn(INVALID_PRODUCT_ID_MESSAGE, str(context.exception))
 
     def test_invalid_quantity_change_validation(self) -> None:
         """Test validation for invalid quantity changes."""
@@ -104,17 +111,12 @@ class TestInventoryLogEntry(unittest.TestCase):
 
     def test_invalid_reason_validation(self) -> None:
         """Test validation for invalid reasons."""
-        with self.assertRaises(ValueError) as context:
-            InventoryLogEntry(product_id=self.valid_product_id,
-                              quantity_change=self.valid_quantity_change, reason="")
-        self.assertIn("Reason must be a non-empty string",
-                      str(context.exception))
-
-        with self.assertRaises(ValueError) as context:
-            InventoryLogEntry(product_id=self.valid_product_id,
-                              quantity_change=self.valid_quantity_change, reason="   ")
-        self.assertIn("Reason must be a non-empty string",
-                      str(context.exception))
+        for reason in ("", "   "):
+            with self.subTest(reason=reason):
+                with self.assertRaises(ValueError) as context:
+                    InventoryLogEntry(product_id=self.valid_product_id,
+                                      quantity_change=self.valid_quantity_change, reason=reason)
+                self.assertIn(INVALID_REASON_MESSAGE, str(context.exception))
 
     def test_reason_whitespace_trimming(self) -> None:
         """Test that reason whitespace is trimmed."""
@@ -128,31 +130,19 @@ class TestInventoryLogEntry(unittest.TestCase):
 
     def test_is_stock_increase_method(self) -> None:
         """Test is_stock_increase method."""
-        positive_entry = InventoryLogEntry(1, 10, "restock")
-        zero_entry = InventoryLogEntry(1, 0, "adjustment")
-        negative_entry = InventoryLogEntry(1, -5, "sale")
-
-        self.assertTrue(positive_entry.is_stock_increase())
-        self.assertFalse(zero_entry.is_stock_increase())
-        self.assertFalse(negative_entry.is_stock_increase())
+        self.assertTrue(self.base_entry.is_stock_increase())
+        self.assertFalse(self.zero_entry.is_stock_increase())
+        self.assertFalse(self.negative_entry.is_stock_increase())
 
     def test_is_stock_decrease_method(self) -> None:
         """Test is_stock_decrease method."""
-        positive_entry = InventoryLogEntry(1, 10, "restock")
-        zero_entry = InventoryLogEntry(1, 0, "adjustment")
-        negative_entry = InventoryLogEntry(1, -5, "sale")
-
-        self.assertFalse(positive_entry.is_stock_decrease())
-        self.assertFalse(zero_entry.is_stock_decrease())
-        self.assertTrue(negative_entry.is_stock_decrease())
+        self.assertFalse(self.base_entry.is_stock_decrease())
+        self.assertFalse(self.zero_entry.is_stock_decrease())
+        self.assertTrue(self.negative_entry.is_stock_decrease())
 
     def test_immutability(self) -> None:
         """Test that InventoryLogEntry is immutable."""
-        entry = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason
-        )
+        entry = self.base_entry
 
         # Properties should not have setters
         with self.assertRaises(AttributeError):
@@ -166,125 +156,62 @@ class TestInventoryLogEntry(unittest.TestCase):
 
     def test_to_dict_method(self) -> None:
         """Test to_dict conversion method."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-        entry = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=custom_time
-        )
-
         expected_dict = {
             "product_id": self.valid_product_id,
             "quantity_change": self.valid_quantity_change,
             "reason": self.valid_reason,
-            "timestamp": custom_time
+            "timestamp": FIXED_DATETIME
         }
 
-        self.assertEqual(entry.to_dict(), expected_dict)
+        self.assertEqual(self.base_entry.to_dict(), expected_dict)
 
     def test_str_method(self) -> None:
         """Test string representation."""
-        positive_entry = InventoryLogEntry(1, 10, "restock")
-        negative_entry = InventoryLogEntry(1, -5, "sale")
-        zero_entry = InventoryLogEntry(1, 0, "adjustment")
-
-        self.assertEqual(str(positive_entry), "Product 1: +10 (restock)")
-        self.assertEqual(str(negative_entry), "Product 1: -5 (sale)")
-        self.assertEqual(str(zero_entry), "Product 1: +0 (adjustment)")
+        self.assertEqual(str(self.base_entry), "Product 1: +10 (restock)")
+        self.assertEqual(str(self.negative_entry), "Product 1: -5 (sale)")
+        self.assertEqual(str(self.zero_entry), "Product 1: +0 (adjustment)")
 
     def test_repr_method(self) -> None:
         """Test detailed representation."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-        entry = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=custom_time
-        )
-
         expected_repr = (
             f"InventoryLogEntry("
             f"product_id={self.valid_product_id}, "
             f"quantity_change={self.valid_quantity_change}, "
             f"reason='{self.valid_reason}', "
-            f"timestamp={custom_time})"
+            f"timestamp={FIXED_DATETIME})"
         )
-        self.assertEqual(repr(entry), expected_repr)
+        self.assertEqual(repr(self.base_entry), expected_repr)
 
     def test_equality_same_entries(self) -> None:
         """Test equality between identical entries."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-
-        entry1 = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=custom_time
-        )
-
-        entry2 = InventoryLogEntry(
+        entry = InventoryLogEntry(
             product_id=self.valid_product_id,
             quantity_change=self.valid_quantity_change,
             reason=self.valid_reason,
-            timestamp=custom_time
+            timestamp=FIXED_DATETIME
         )
 
-        self.assertEqual(entry1, entry2)
-        self.assertTrue(entry1 == entry2)
+        self.assertEqual(self.base_entry, entry)
+        self.assertTrue(self.base_entry == entry)
 
     def test_inequality_different_entries(self) -> None:
         """Test inequality between different entries."""
-        base_entry = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=self.fixed_datetime
-        )
-
-        # Different product_id
-        diff_product = InventoryLogEntry(
-            product_id=2,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=self.fixed_datetime
-        )
-        self.assertNotEqual(base_entry, diff_product)
-
-        # Different quantity_change
-        diff_quantity = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=-5,
-            reason=self.valid_reason,
-            timestamp=self.fixed_datetime
-        )
-        self.assertNotEqual(base_entry, diff_quantity)
-
-        # Different reason
-        diff_reason = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason="sale",
-            timestamp=self.fixed_datetime
-        )
-        self.assertNotEqual(base_entry, diff_reason)
+        differing_fields = [
+            ("product_id", 2),
+            ("quantity_change", -5),
+            ("reason", "sale"),
+            ("timestamp", datetime.datetime(2024, 2, 15, 10, 30, 0)),
+        ]
+        base_fields = self.base_entry.to_dict()
 
-        # Different timestamp
-        diff_time = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=datetime.datetime(2024, 2, 15, 10, 30, 0)
-        )
-        self.assertNotEqual(base_entry, diff_time)
+        for field, value in differing_fields:
+            with self.subTest(field=field):
+                other = InventoryLogEntry(**{**base_fields, field: value})
+                self.assertNotEqual(self.base_entry, other)
 
     def test_equality_with_non_inventory_log_entry(self) -> None:
         """Test equality with non-InventoryLogEntry objects."""
-        entry = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason
-        )
+        entry = self.base_entry
 
         non_entries = [
             "not an entry",
@@ -301,37 +228,27 @@ class TestInventoryLogEntry(unittest.TestCase):
 
     def test_hash_consistency(self) -> None:
         """Test that hash is consistent for equal entries."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-
-        entry1 = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=custom_time
-        )
-
-        entry2 = InventoryLogEntry(
+        entry = InventoryLogEntry(
             product_id=self.valid_product_id,
             quantity_change=self.valid_quantity_change,
             reason=self.valid_reason,
-            timestamp=custom_time
+            timestamp=FIXED_DATETIME
         )
 
         # Equal objects must have equal hashes
-        self.assertEqual(hash(entry1), hash(entry2))
+        self.assertEqual(hash(self.base_entry), hash(entry))
 
     def test_hash_different_for_different_entries(self) -> None:
         """Test that different entries have different hashes."""
-        entry1 = InventoryLogEntry(1, 10, "restock", self.fixed_datetime)
-        entry2 = InventoryLogEntry(2, 10, "restock", self.fixed_datetime)
+        entry2 = InventoryLogEntry(2, 10, "restock", FIXED_DATETIME)
 
         # Different entries should have different hashes (usually)
-        self.assertNotEqual(hash(entry1), hash(entry2))
+        self.assertNotEqual(hash(self.base_entry), hash(entry2))
 
     def test_can_be_used_in_set(self) -> None:
         """Test that InventoryLogEntry can be used in sets."""
-        entry1 = InventoryLogEntry(1, 10, "restock", self.fixed_datetime)
-        entry2 = InventoryLogEntry(2, -5, "sale", self.fixed_datetime)
+        entry1 = self.base_entry
+        entry2 = InventoryLogEntry(2, -5, "sale", FIXED_DATETIME)
 
         # Should be able to add to set
         entry_set = {entry1, entry2}
@@ -343,12 +260,7 @@ class TestInventoryLogEntry(unittest.TestCase):
 
     def test_can_be_used_as_dict_key(self) -> None:
         """Test that InventoryLogEntry can be used as dictionary keys."""
-        entry = InventoryLogEntry(
-            product_id=self.valid_product_id,
-            quantity_change=self.valid_quantity_change,
-            reason=self.valid_reason,
-            timestamp=self.fixed_datetime
-        )
+        entry = self.base_entry
 
         # Should be able to use as dict key
         entry_dict = {entry: "processed"}
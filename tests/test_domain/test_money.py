@@ -2,50 +2,44 @@
 Test Money value object - validation and arithmetic operations
 Tests the refactored Money class from domain layer
 """
+import operator
 import unittest
 from domain.value_objects.money import Money
 
+# Shared operands for the arithmetic and comparison tables
+MONEY_100 = Money(100)
+MONEY_50 = Money(50)
+
 
 class TestMoney(unittest.TestCase):
     """Test Money value object validation and operations."""
 
     def test_money_creation_valid(self) -> None:
         """Test creating Money with valid amounts."""
-        # Test with integer
-        money1 = Money(100)
-        self.assertEqual(money1.value, 100.0)
-
-        # Test with float
-        money2 = Money(99.99)
-        self.assertEqual(money2.value, 99.99)
-
-        # Test with zero
-        money3 = Money(0)
-        self.assertEqual(money3.value, 0.0)
-
-    def test_money_creation_edge_cases(self) -> None:
-        """Test Money creation with edge cases."""
-        # Test with negative amount (should raise ValueError)
-        with self.assertRaises(ValueError):
-            Money(-1)
+        valid_amounts = [
+            (100, 100.0),  # Integer
+            (99.99, 99.99),  # Float
+            (0, 0.0),  # Zero
+            (0.01, 0.01),  # Very small amount
+        ]
 
-        # Test with very small amount
-        money_small = Money(0.01)
-        self.assertEqual(money_small.value, 0.01)
+        for amount, expected in valid_amounts:
+            with self.subTest(amount=amount):
+                self.assertEqual(Money(amount).value, expected)
 
     def test_money_creation_invalid(self) -> None:
         """Test Money creation with invalid values."""
-        # Test with negative amount
-        with self.assertRaises(ValueError):
-            Money(-50.0)
-
-        # Test with NaN
-        with self.assertRaises(ValueError):
-            Money(float('nan'))
-
-        # Test with infinity
-        with self.assertRaises(ValueError):
-            Money(float('inf'))
+        invalid_amounts = [
+            -1,  # Negative amount
+            -50.0,  # Negative float amount
+            float('nan'),  # NaN
+            float('inf'),  # Infinity
+        ]
+
+        for amount in invalid_amounts:
+            with self.subTest(amount=amount):
+                with self.assertRaises(ValueError):
+                    Money(amount)
 
         # Note: String validation is a type error caught by mypy at compile time
         # If runtime validation is needed, it should be tested separately
@@ -53,58 +47,39 @@ class TestMoney(unittest.TestCase):
 
     def test_money_arithmetic_operations(self) -> None:
         """Test Money arithmetic operations."""
-        money1 = Money(100)
-        money2 = Money(50)
-
-        # Addition
-        result_add = money1 + money2
-        self.assertEqual(result_add.value, 150.0)
-
-        # Addition with number
-        result_add_num = money1 + 25
-        self.assertEqual(result_add_num.value, 125.0)
-
-        # Subtraction
-        result_sub = money1 - money2
-        self.assertEqual(result_sub.value, 50.0)
-
-        # Subtraction with number
-        result_sub_num = money1 - 25
-        self.assertEqual(result_sub_num.value, 75.0)
-
-        # Multiplication
-        result_mul = money1 * 2
-        self.assertEqual(result_mul.value, 200.0)
-
-        # Division
-        result_div = money1 / 2
-        self.assertEqual(result_div.value, 50.0)
+        operations = [
+            (operator.add, MONEY_50, 150.0),  # Addition
+            (operator.add, 25, 125.0),  # Addition with number
+            (operator.sub, MONEY_50, 50.0),  # Subtraction
+            (operator.sub, 25, 75.0),  # Subtraction with number
+            (operator.mul, 2, 200.0),  # Multiplication
+            (operator.truediv, 2, 50.0),  # Division
+        ]
+
+        for op, other, expected in operations:
+            with self.subTest(op=op.__name__, other=other):
+                self.assertEqual(op(MONEY_100, other).value, expected)
 
     def test_money_comparison_operations(self) -> None:
         """Test Money comparison operations."""
-        money1 = Money(100)
-        money2 = Money(50)
         money3 = Money(100)
 
-        # Less than
-        self.assertTrue(money2 < money1)
-        self.assertFalse(money1 < money2)
-
-        # Less than or equal
-        self.assertTrue(money2 <= money1)
-        self.assertTrue(money1 <= money3)
-
-        # Greater than
-        self.assertTrue(money1 > money2)
-        self.assertFalse(money2 > money1)
-
-        # Greater than or equal
-        self.assertTrue(money1 >= money2)
-        self.assertTrue(money1 >= money3)
-
-        # Equality
-        self.assertTrue(money1 == money3)
-        self.assertFalse(money1 == money2)
+        comparisons = [
+            (operator.lt, MONEY_50, MONEY_100, True),  # Less than
+            (operator.lt, MONEY_100, MONEY_50, False),
+            (operator.le, MONEY_50, MONEY_100, True),  # Less than or equal
+            (operator.le, MONEY_100, money3, True),
+            (operator.gt, MONEY_100, MONEY_50, True),  # Greater than
+            (operator.gt, MONEY_50, MONEY_100, False),
+            (operator.ge, MONEY_100, MONEY_50, True),  # Greater than or equal
+            (operator.ge, MONEY_100, money3, True),
+            (operator.eq, MONEY_100, money3, True),  # Equality
+            (operator.eq, MONEY_100, MONEY_50, False),
+        ]
+
+        for op, left, right, expected in comparisons:
+            with self.subTest(op=op.__name__, left=left, right=right):
+                self.assertIs(op(left, right), expected)
 
     def test_money_string_representation(self) -> None:
         """Test Money string representation."""
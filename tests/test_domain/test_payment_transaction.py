@@ -2,173 +2,151 @@
 Test cases for PaymentTransaction value object.
 Tests immutability, validation, and all public methods.
 """
-from typing import Any
+from typing import Any, ClassVar
 import unittest
-import unittest.mock
 import datetime
-from unittest.mock import patch
+import itertools
 from domain.value_objects.payment_transaction import PaymentTransaction
 from domain.value_objects.money import Money
 from domain.enums.payment_method import PaymentMethod
 from domain.enums.payment_status import PaymentStatus
+from tests.clock import FIXED_DATETIME
+
+# Shared fixture values, resolved once for the whole module
+VALID_ORDER_ID = 1001
+VALID_MONEY = Money(99.99)
+VALID_AMOUNT = VALID_MONEY.value
+VALID_PAYMENT_METHOD = PaymentMethod.CREDIT_CARD
+VALID_STATUS = PaymentStatus.COMPLETED
+
+# Other Money values compared against transaction amounts
+MONEY_100 = Money(100)
+MONEY_200 = Money(200.0)
+
+
+def _transaction(**overrides: Any) -> PaymentTransaction:
+    """Build a valid transaction stamped FIXED_DATETIME, with fields replaced."""
+    fields: dict[str, Any] = {
+        "order_id": VALID_ORDER_ID,
+        "amount": VALID_AMOUNT,
+        "payment_method": VALID_PAYMENT_METHOD,
+        "status": VALID_STATUS,
+        "created_at": FIXED_DATETIME,
+        **overrides,
+    }
+    return PaymentTransaction(**fields)
 
 
 class TestPaymentTransaction(unittest.TestCase):
     """Test cases for PaymentTransaction value object."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.valid_order_id = 1001
-        self.valid_amount = 99.99
-        self.valid_payment_method = PaymentMethod.CREDIT_CARD
-        self.valid_status = PaymentStatus.COMPLETED
-        self.fixed_datetime = datetime.datetime(2024, 1, 15, 10, 30, 0)
+    # Values of other types that must never equal a transaction
+    NON_TRANSACTIONS: tuple[object, ...] = (
+        "not a transaction",
+        123,
+        {"order_id": VALID_ORDER_ID},
+        None,
+        []
+    )
+
+    # Edge-case (amount, expected Money) pairs and order IDs, built once
+    EDGE_AMOUNTS = tuple(
+        (amount, Money(amount)) for amount in (0.01, 0.1, 1.0, 999999.99)
+    )
+    EDGE_ORDER_IDS = (1, 999999)
+
+    valid_transaction: ClassVar[PaymentTransaction]
+    other_transaction: ClassVar[PaymentTransaction]
+    valid_transaction_dict: ClassVar[dict[str, Any]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build one valid transaction and its dict form for read-only tests."""
+        cls.valid_transaction = _transaction()
+        cls.other_transaction = _transaction(
+            order_id=1002,
+            amount=150.00,
+            payment_method=PaymentMethod.PAYPAL,
+            status=PaymentStatus.PENDING
+        )
+        cls.valid_transaction_dict = {
+            "order_id": VALID_ORDER_ID,
+            "amount": VALID_AMOUNT,
+            "payment_method": VALID_PAYMENT_METHOD,
+            "status": VALID_STATUS,
+            "created_at": FIXED_DATETIME
+        }
 
     def test_valid_payment_transaction_creation(self) -> None:
         """Test creation of valid payment transaction."""
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status
-        )
+        transaction = _transaction(created_at=None)
 
-        self.assertEqual(transaction.order_id, self.valid_order_id)
-        self.assertEqual(transaction.amount, Money(self.valid_amount))
-        self.assertEqual(transaction.payment_method, self.valid_payment_method)
-        self.assertEqual(transaction.status, self.valid_status)
+        self.assertEqual(transaction.order_id, VALID_ORDER_ID)
+        self.assertEqual(transaction.amount, VALID_MONEY)
+        self.assertEqual(transaction.payment_method, VALID_PAYMENT_METHOD)
+        self.assertEqual(transaction.status, VALID_STATUS)
         self.assertIsInstance(transaction.created_at, datetime.datetime)
 
     def test_payment_transaction_with_custom_created_at(self) -> None:
         """Test creation with custom created_at timestamp."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=custom_time
-        )
+        transaction = _transaction(created_at=FIXED_DATETIME)
 
-        self.assertEqual(transaction.created_at, custom_time)
+        self.assertEqual(transaction.created_at, FIXED_DATETIME)
 
-    @patch('datetime.datetime')
-    def test_payment_transaction_default_created_at(self, mock_datetime: unittest.mock.MagicMock) -> None:
+    def test_payment_transaction_default_created_at(self) -> None:
         """Test that created_at defaults to current time when not provided."""
-        mock_datetime.now.return_value = self.fixed_datetime
-        mock_datetime.side_effect = datetime.datetime
-
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status
-        )
+        before = datetime.datetime.now()
+        transaction = _transaction(created_at=None)
+        after = datetime.datetime.now()
 
-        mock_datetime.now.assert_called_once()
-        self.assertEqual(transaction.created_at, self.fixed_datetime)
+        self.assertLessEqual(before, transaction.created_at)
+        self.assertLessEqual(transaction.created_at, after)
 
     def test_invalid_order_id_validation(self) -> None:
         """Test validation for invalid order IDs."""
-        # Test each invalid case individually
-        with self.assertRaises(ValueError) as context:
-            PaymentTransaction(order_id=0, amount=self.valid_amount,
-                               payment_method=self.valid_payment_method, status=self.valid_status)
-        self.assertIn("Order ID must be a positive integer",
-                      str(context.exception))
-
-        with self.assertRaises(ValueError) as context:
-            PaymentTransaction(order_id=-1, amount=self.valid_amount,
-                               payment_method=self.valid_payment_method, status=self.valid_status)
-        self.assertIn("Order ID must be a positive integer",
-                      str(context.exception))
-
-        with self.assertRaises(ValueError) as context:
-            PaymentTransaction(order_id=-100, amount=self.valid_amount,
-                               payment_method=self.valid_payment_method, status=self.valid_status)
-        self.assertIn("Order ID must be a positive integer",
-                      str(context.exception))
+        for order_id in [0, -1, -100]:
+            with self.subTest(order_id=order_id):
+                with self.assertRaises(ValueError) as context:
+                    _transaction(order_id=order_id)
+                self.assertIn("Order ID must be a positive integer",
+                              str(context.exception))
 
     def test_invalid_amount_validation(self) -> None:
         """Test validation for invalid amounts."""
-        # Test each invalid case individually
-        with self.assertRaises(ValueError) as context:
-            PaymentTransaction(order_id=self.valid_order_id, amount=0,
-                               payment_method=self.valid_payment_method, status=self.valid_status)
-        self.assertIn("Amount must be a positive number",
-                      str(context.exception))
-
-        with self.assertRaises(ValueError) as context:
-            PaymentTransaction(order_id=self.valid_order_id, amount=-1,
-                               payment_method=self.valid_payment_method, status=self.valid_status)
-        self.assertIn("Amount must be a positive number",
-                      str(context.exception))
-
-        with self.assertRaises(ValueError) as context:
-            PaymentTransaction(order_id=self.valid_order_id, amount=-0.01,
-                               payment_method=self.valid_payment_method, status=self.valid_status)
-        self.assertIn("Amount must be a positive number",
-                      str(context.exception))
+        for amount in [0, -1, -0.01]:
+            with self.subTest(amount=amount):
+                with self.assertRaises(ValueError) as context:
+                    _transaction(amount=amount)
+                self.assertIn("Amount must be a positive number",
+                              str(context.exception))
 
     def test_valid_amount_types(self) -> None:
         """Test that both int and float amounts are accepted."""
         # Test integer amount
-        transaction_int = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=100,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status
-        )
-        self.assertEqual(transaction_int.amount, Money(100))
+        transaction_int = _transaction(amount=100)
+        self.assertEqual(transaction_int.amount, MONEY_100)
 
         # Test float amount
-        transaction_float = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=99.99,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status
-        )
-        self.assertEqual(transaction_float.amount, Money(99.99))
-
-    def test_all_payment_methods(self) -> None:
-        """Test creation with all available payment methods."""
-        for method in PaymentMethod:
-            with self.subTest(payment_method=method):
-                transaction = PaymentTransaction(
-                    order_id=self.valid_order_id,
-                    amount=self.valid_amount,
-                    payment_method=method,
-                    status=self.valid_status
-                )
+        transaction_float = _transaction(amount=99.99)
+        self.assertEqual(transaction_float.amount, VALID_MONEY)
+
+    def test_all_payment_methods_and_statuses(self) -> None:
+        """Test creation with every payment method and status combination."""
+        for method, status in itertools.product(PaymentMethod, PaymentStatus):
+            with self.subTest(payment_method=method, payment_status=status):
+                transaction = _transaction(payment_method=method, status=status)
                 self.assertEqual(transaction.payment_method, method)
-
-    def test_all_payment_statuses(self) -> None:
-        """Test creation with all available payment statuses."""
-        for status in PaymentStatus:
-            with self.subTest(payment_status=status):
-                transaction = PaymentTransaction(
-                    order_id=self.valid_order_id,
-                    amount=self.valid_amount,
-                    payment_method=self.valid_payment_method,
-                    status=status
-                )
                 self.assertEqual(transaction.status, status)
 
     def test_immutability(self) -> None:
         """Test that PaymentTransaction is immutable."""
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status
-        )
+        transaction = self.valid_transaction
 
         # Properties should not have setters - use setattr for proper testing
         with self.assertRaises(AttributeError):
             setattr(transaction, 'order_id', 2000)
         with self.assertRaises(AttributeError):
-            setattr(transaction, 'amount', Money(200.0))
+            setattr(transaction, 'amount', MONEY_200)
         with self.assertRaises(AttributeError):
             setattr(transaction, 'payment_method', PaymentMethod.PAYPAL)
         with self.assertRaises(AttributeError):
@@ -178,224 +156,72 @@ class TestPaymentTransaction(unittest.TestCase):
 
     def test_to_dict_method(self) -> None:
         """Test to_dict conversion method."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=custom_time
-        )
-
-        expected_dict = {
-            "order_id": self.valid_order_id,
-            "amount": self.valid_amount,
-            "payment_method": self.valid_payment_method,
-            "status": self.valid_status,
-            "created_at": custom_time
-        }
-
-        self.assertEqual(transaction.to_dict(), expected_dict)
+        self.assertEqual(self.valid_transaction.to_dict(), self.valid_transaction_dict)
 
     def test_str_method(self) -> None:
         """Test string representation."""
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status
-        )
+        transaction = self.valid_transaction
 
-        expected_str = f"Payment ${self.valid_amount} for order {self.valid_order_id} via {self.valid_payment_method.value}"
+        expected_str = f"Payment ${VALID_AMOUNT} for order {VALID_ORDER_ID} via {VALID_PAYMENT_METHOD.value}"
         self.assertEqual(str(transaction), expected_str)
 
     def test_repr_method(self) -> None:
         """Test detailed representation."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=custom_time
-        )
+        transaction = self.valid_transaction
 
         expected_repr = (
             f"PaymentTransaction("
-            f"order_id={self.valid_order_id}, "
-            f"amount={self.valid_amount}, "
-            f"payment_method={self.valid_payment_method}, "
-            f"status={self.valid_status}, "
-            f"created_at={custom_time})"
+            f"order_id={VALID_ORDER_ID}, "
+            f"amount={VALID_AMOUNT}, "
+            f"payment_method={VALID_PAYMENT_METHOD}, "
+            f"status={VALID_STATUS}, "
+            f"created_at={FIXED_DATETIME})"
         )
         self.assertEqual(repr(transaction), expected_repr)
 
     def test_equality_same_transactions(self) -> None:
         """Test equality between identical transactions."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-
-        transaction1 = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=custom_time
-        )
-
-        transaction2 = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=custom_time
-        )
+        transaction1 = self.valid_transaction
+        transaction2 = _transaction()
 
         self.assertEqual(transaction1, transaction2)
-        self.assertTrue(transaction1 == transaction2)
 
     def test_inequality_different_transactions(self) -> None:
         """Test inequality between different transactions."""
-        base_transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=self.fixed_datetime
-        )
+        base_transaction = self.valid_transaction
 
-        # Different order_id
-        diff_order = PaymentTransaction(
-            order_id=2000,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=self.fixed_datetime
-        )
-        self.assertNotEqual(base_transaction, diff_order)
-
-        # Different amount
-        diff_amount = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=200.00,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=self.fixed_datetime
+        differing_fields: tuple[dict[str, Any], ...] = (
+            {"order_id": 2000},
+            {"amount": 200.00},
+            {"payment_method": PaymentMethod.PAYPAL},
+            {"status": PaymentStatus.FAILED},
+            {"created_at": datetime.datetime(2024, 2, 15, 10, 30, 0)},
         )
-        self.assertNotEqual(base_transaction, diff_amount)
 
-        # Different payment method
-        diff_method = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=PaymentMethod.PAYPAL,
-            status=self.valid_status,
-            created_at=self.fixed_datetime
-        )
-        self.assertNotEqual(base_transaction, diff_method)
-
-        # Different status
-        diff_status = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=PaymentStatus.FAILED,
-            created_at=self.fixed_datetime
-        )
-        self.assertNotEqual(base_transaction, diff_status)
-
-        # Different created_at
-        diff_time = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=datetime.datetime(2024, 2, 15, 10, 30, 0)
-        )
-        self.assertNotEqual(base_transaction, diff_time)
+        for overrides in differing_fields:
+            with self.subTest(overrides=overrides):
+                self.assertNotEqual(base_transaction, _transaction(**overrides))
 
     def test_equality_with_non_payment_transaction(self) -> None:
         """Test equality with non-PaymentTransaction objects."""
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status
-        )
+        transaction = self.valid_transaction
 
-        non_transactions = [
-            "not a transaction",
-            123,
-            {"order_id": self.valid_order_id},
-            None,
-            []
-        ]
-
-        for non_transaction in non_transactions:
+        for non_transaction in self.NON_TRANSACTIONS:
             with self.subTest(other=non_transaction):
                 self.assertNotEqual(transaction, non_transaction)
-                self.assertFalse(transaction == non_transaction)
 
     def test_hash_consistency(self) -> None:
         """Test that hash is consistent for equal transactions."""
-        custom_time = datetime.datetime(2024, 1, 15, 10, 30, 0)
-
-        transaction1 = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=custom_time
-        )
-
-        transaction2 = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=custom_time
-        )
+        transaction1 = self.valid_transaction
+        transaction2 = _transaction()
 
         # Equal objects must have equal hashes
         self.assertEqual(hash(transaction1), hash(transaction2))
 
-    def test_hash_different_for_different_transactions(self) -> None:
-        """Test that different transactions have different hashes."""
-        transaction1 = PaymentTransaction(
-            order_id=1001,
-            amount=99.99,
-            payment_method=PaymentMethod.CREDIT_CARD,
-            status=PaymentStatus.COMPLETED,
-            created_at=self.fixed_datetime
-        )
-
-        transaction2 = PaymentTransaction(
-            order_id=1002,
-            amount=99.99,
-            payment_method=PaymentMethod.CREDIT_CARD,
-            status=PaymentStatus.COMPLETED,
-            created_at=self.fixed_datetime
-        )
-
-        # Different transactions should have different hashes (usually)
-        self.assertNotEqual(hash(transaction1), hash(transaction2))
-
-    def test_can_be_used_in_set(self) -> None:
-        """Test that PaymentTransaction can be used in sets."""
-        transaction1 = PaymentTransaction(
-            order_id=1001,
-            amount=99.99,
-            payment_method=PaymentMethod.CREDIT_CARD,
-            status=PaymentStatus.COMPLETED,
-            created_at=self.fixed_datetime
-        )
-
-        transaction2 = PaymentTransaction(
-            order_id=1002,
-            amount=150.00,
-            payment_method=PaymentMethod.PAYPAL,
-            status=PaymentStatus.PENDING,
-            created_at=self.fixed_datetime
-        )
+    def test_can_be_used_in_set_and_as_dict_key(self) -> None:
+        """Test that PaymentTransaction can be used in sets and as dict keys."""
+        transaction1 = self.valid_transaction
+        transaction2 = self.other_transaction
 
         # Should be able to add to set
         transaction_set = {transaction1, transaction2}
@@ -405,48 +231,24 @@ class TestPaymentTransaction(unittest.TestCase):
         transaction_set.add(transaction1)
         self.assertEqual(len(transaction_set), 2)
 
-    def test_can_be_used_as_dict_key(self) -> None:
-        """Test that PaymentTransaction can be used as dictionary keys."""
-        transaction = PaymentTransaction(
-            order_id=self.valid_order_id,
-            amount=self.valid_amount,
-            payment_method=self.valid_payment_method,
-            status=self.valid_status,
-            created_at=self.fixed_datetime
-        )
-
         # Should be able to use as dict key
-        transaction_dict = {transaction: "processed"}
-        self.assertEqual(transaction_dict[transaction], "processed")
+        transaction_dict = {transaction1: "processed"}
+        self.assertEqual(transaction_dict[transaction1], "processed")
 
     def test_edge_case_amounts(self) -> None:
         """Test edge cases for amount values."""
-        edge_amounts = [0.01, 0.1, 1.0, 999999.99]
-
-        for amount in edge_amounts:
+        for amount, expected in self.EDGE_AMOUNTS:
             with self.subTest(amount=amount):
-                transaction = PaymentTransaction(
-                    order_id=self.valid_order_id,
-                    amount=amount,
-                    payment_method=self.valid_payment_method,
-                    status=self.valid_status
-                )
-                self.assertEqual(transaction.amount, Money(amount))
+                transaction = _transaction(amount=amount)
+                self.assertEqual(transaction.amount, expected)
 
     def test_edge_case_order_ids(self) -> None:
         """Test edge cases for order ID values."""
-        edge_order_ids = [1, 999999]
-
-        for order_id in edge_order_ids:
+        for order_id in self.EDGE_ORDER_IDS:
             with self.subTest(order_id=order_id):
-                transaction = PaymentTransaction(
-                    order_id=order_id,
-                    amount=self.valid_amount,
-                    payment_method=self.valid_payment_method,
-                    status=self.valid_status
-                )
+                transaction = _transaction(order_id=order_id)
                 self.assertEqual(transaction.order_id, order_id)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
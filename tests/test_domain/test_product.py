@@ -2,17 +2,32 @@
 Test Product domain model - validation and business rules
 Tests the refactored Product class business logic
 """
+from typing import ClassVar
 import unittest
 from domain.models.product import Product
 from domain.enums.product_category import ProductCategory
 
+# (name, price, quantity_available, category, weight) rows with exactly one
+# invalid field
+_INVALID_PRODUCT_CASES: tuple[tuple[str, float, int, str, float], ...] = (
+    ("Test Product", -10.0, 10, "Electronics", 1.5),  # Invalid negative price
+    ("Test Product", 99.99, -5, "Electronics", 1.5),  # Invalid negative quantity
+    ("Test Product", 99.99, 10, "Electronics", -1.0),  # Invalid negative weight
+    ("", 99.99, 10, "Electronics", 1.5),  # Invalid empty name
+    ("Test Product", 99.99, 10, "", 1.5),  # Invalid - empty string not in enum
+    ("Test Product", 99.99, 10, "InvalidCategory", 1.5),  # Invalid - not in enum
+)
+
 
 class TestProduct(unittest.TestCase):
     """Test Product domain model validation and business rules."""
 
-    def test_product_creation_valid(self) -> None:
-        """Test creating Product with valid data."""
-        product = Product(
+    valid_product: ClassVar[Product]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build one valid product shared by read-only tests."""
+        cls.valid_product = Product(
             product_id=1,
             name="Test Product",
             price=99.99,
@@ -21,6 +36,10 @@ class TestProduct(unittest.TestCase):
             weight=1.5,
             supplier_id=1
         )
+
+    def test_product_creation_valid(self) -> None:
+        """Test creating Product with valid data."""
+        product = self.valid_product
         
         self.assertEqual(product.product_id, 1)
         self.assertEqual(product.name, "Test Product")
@@ -30,112 +49,47 @@ class TestProduct(unittest.TestCase):
         self.assertEqual(product.weight, 1.5)
         self.assertEqual(product.supplier_id, 1)
 
-    def test_product_validation_invalid_price(self) -> None:
-        """Test Product validation - should reject negative price."""
-        with self.assertRaises(ValueError):
-            Product(
-                product_id=1,
-                name="Test Product",
-                price=-10.0,  # Invalid negative price
-                quantity_available=10,
-                category="Electronics",
-                weight=1.5,
-                supplier_id=1
-            )
+    def test_product_validation_invalid_fields(self) -> None:
+        """Test Product validation - should reject each invalid field."""
+        for name, price, quantity, category, weight in _INVALID_PRODUCT_CASES:
+            with self.subTest(name=name, price=price, quantity=quantity,
+                              category=category, weight=weight):
+                with self.assertRaises(ValueError):
+                    Product(
+                        product_id=1,
+                        name=name,
+                        price=price,
+                        quantity_available=quantity,
+                        category=category,
+                        weight=weight,
+                        supplier_id=1
+                    )
 
-    def test_product_validation_invalid_quantity(self) -> None:
-        """Test Product validation - should reject negative quantity."""
-        with self.assertRaises(ValueError):
-            Product(
-                product_id=1,
-                name="Test Product",
-                price=99.99,
-                quantity_available=-5,  # Invalid negative quantity
-                category="Electronics",
-                weight=1.5,
-                supplier_id=1
-            )
+    def test_product_declares_slots(self) -> None:
+        """Test Product stores its state in __slots__ rather than a __dict__."""
+        self.assertTrue(hasattr(Product, '__slots__'))
+        self.assertFalse(hasattr(self.valid_product, '__dict__'))
 
-    def test_product_validation_invalid_weight(self) -> None:
-        """Test Product validation - should reject negative weight."""
-        with self.assertRaises(ValueError):
-            Product(
-                product_id=1,
-                name="Test Product",
-                price=99.99,
-                quantity_available=10,
-                category="Electronics",
-                weight=-1.0,  # Invalid negative weight
-                supplier_id=1
-            )
-
-    def test_product_validation_empty_name(self) -> None:
-        """Test Product validation - should reject empty name."""
-        with self.assertRaises(ValueError):
-            Product(
-                product_id=1,
-                name="",  # Invalid empty name
-                price=99.99,
-                quantity_available=10,
-                category="Electronics",
-                weight=1.5,
-                supplier_id=1
-            )
-
-    def test_product_validation_category_edge_cases(self) -> None:
-        """Test Product validation - test invalid category inputs."""
-        # Empty category should raise ValueError now that we use enum
-        with self.assertRaises(ValueError):
-            Product(
-                product_id=1,
-                name="Test Product",
-                price=99.99,
-                quantity_available=10,
-                category="",  # Invalid - empty string not in enum
-                weight=1.5,
-                supplier_id=1
-            )
-
-        # Invalid category should also raise ValueError
-        with self.assertRaises(ValueError):
-            Product(
-                product_id=2,
-                name="Test Product 2",
-                price=99.99,
-                quantity_available=10,
-                category="InvalidCategory",  # Invalid - not in enum
-                weight=1.5,
-                supplier_id=1
-            )
-
-        # Valid category should work fine
-        valid_product = Product(
-            product_id=3,
-            name="Valid Product",
+    def test_product_category_enum_accepted(self) -> None:
+        """Test Product accepts a ProductCategory member directly."""
+        product = Product(
+            product_id=1,
+            name="Test Product",
             price=99.99,
             quantity_available=10,
-            category=ProductCategory.ELECTRONICS,  # Valid enum value
+            category=ProductCategory.ELECTRONICS,
             weight=1.5,
             supplier_id=1
         )
-        self.assertEqual(valid_product.category, ProductCategory.ELECTRONICS)
+        self.assertEqual(product.category, ProductCategory.ELECTRONICS)
 
     def test_product_availability_check(self) -> None:
         """Test Product availability based on quantity."""
         # Product with stock
-        product1 = Product(
-            product_id=1,
-            name="Test Product",
-            price=99.99,
-            quantity_available=10,
-            category="Electronics",
-            weight=1.5,
-            supplier_id=1
-        )
-        self.assertGreater(product1.quantity_available, 0)
+        self.assertGreater(self.valid_product.quantity_available, 0)
         
         # Product without stock
-        product2 = Product(
+        out_of_stock = Product(
             product_id=2,
             name="Out of Stock Product",
             price=99.99,
@@ -144,19 +98,11 @@ class TestProduct(unittest.TestCase):
             weight=1.5,
             supplier_id=1
         )
-        self.assertEqual(product2.quantity_available, 0)
+        self.assertEqual(out_of_stock.quantity_available, 0)
 
     def test_product_object_creation(self) -> None:
         """Test Product object creation and basic properties."""
-        product = Product(
-            product_id=1,
-            name="Test Product",
-            price=99.99,
-            quantity_available=10,
-            category="Electronics",
-            weight=1.5,
-            supplier_id=1
-        )
+        product = self.valid_product
         
         # Test that object is created successfully
         self.assertIsInstance(product, Product)
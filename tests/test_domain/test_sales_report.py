@@ -2,23 +2,53 @@
 Test SalesReport value object - validation and immutability
 Tests sales report creation and data integrity
 """
+from typing import ClassVar
 import unittest
 from domain.value_objects.sales_report import SalesReport
 
+# Full str/repr of the canonical report built in setUpClass
+EXPECTED_STR = "Sales Report: $1000.00 revenue, 10 orders, 2 cancelled"
+EXPECTED_REPR = "SalesReport(total_sales=1000.0, total_orders=10, cancelled_orders=2)"
+
+# (total_sales, total_orders, cancelled_orders, expected message pattern) rows
+# with exactly one negative field
+_NEGATIVE_FIELD_CASES: tuple[tuple[float, int, int, str], ...] = (
+    (-100.0, 10, 2, "Total sales cannot be negative"),
+    (1000.0, -5, 2, "Total orders cannot be negative"),
+    (1000.0, 10, -2, "Cancelled orders cannot be negative"),
+)
+
 
 class TestSalesReport(unittest.TestCase):
     """Test SalesReport value object."""
 
+    # Fields of the canonical report; SalesReport copies the collections
+    valid_total_sales = 1000.0
+    valid_total_orders = 10
+    valid_cancelled_orders = 2
+    valid_products_sold = {1: 5, 2: 3}
+    valid_revenue_by_category = {"Electronics": 800.0, "Books": 200.0}
+    valid_top_customers = [(101, 500.0), (102, 300.0)]
+
+    report: ClassVar[SalesReport]
+    report_set: ClassVar[set[SalesReport]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build one canonical report and its set shared by read-only tests."""
+        cls.report = SalesReport(
+            total_sales=cls.valid_total_sales,
+            total_orders=cls.valid_total_orders,
+            cancelled_orders=cls.valid_cancelled_orders,
+            products_sold=cls.valid_products_sold,
+            revenue_by_category=cls.valid_revenue_by_category,
+            top_customers=cls.valid_top_customers
+        )
+        cls.report_set = {cls.report}
+
     def test_sales_report_creation_valid(self) -> None:
         """Test creating SalesReport with valid data."""
-        report = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={1: 5, 2: 3},
-            revenue_by_category={"Electronics": 800.0, "Books": 200.0},
-            top_customers=[(101, 500.0), (102, 300.0)]
-        )
+        report = self.report
         
         self.assertEqual(report.total_sales, 1000.0)
         self.assertEqual(report.total_orders, 10)
@@ -27,58 +57,30 @@ class TestSalesReport(unittest.TestCase):
         self.assertEqual(report.revenue_by_category, {"Electronics": 800.0, "Books": 200.0})
         self.assertEqual(report.top_customers, [(101, 500.0), (102, 300.0)])
 
-    def test_negative_total_sales(self) -> None:
-        """Test validation for negative total sales."""
-        with self.assertRaises(ValueError) as context:
-            SalesReport(
-                total_sales=-100.0,  # Invalid
-                total_orders=5,
-                cancelled_orders=0,
-                products_sold={},
-                revenue_by_category={},
-                top_customers=[]
-            )
-        self.assertIn("Total sales cannot be negative", str(context.exception))
-
-    def test_negative_total_orders(self) -> None:
-        """Test validation for negative total orders."""
-        with self.assertRaises(ValueError) as context:
-            SalesReport(
-                total_sales=100.0,
-                total_orders=-5,  # Invalid
-                cancelled_orders=0,
-                products_sold={},
-                revenue_by_category={},
-                top_customers=[]
-            )
-        self.assertIn("Total orders cannot be negative", str(context.exception))
-
-    def test_negative_cancelled_orders(self) -> None:
-        """Test validation for negative cancelled orders."""
-        with self.assertRaises(ValueError) as context:
-            SalesReport(
-                total_sales=100.0,
-                total_orders=5,
-                cancelled_orders=-2,  # Invalid
-                products_sold={},
-                revenue_by_category={},
-                top_customers=[]
-            )
-        self.assertIn("Cancelled orders cannot be negative", str(context.exception))
+    def test_negative_counts_rejected(self) -> None:
+        """Test validation for negative sales and order counts."""
+        for total_sales, total_orders, cancelled_orders, message in _NEGATIVE_FIELD_CASES:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(ValueError, message):
+                    SalesReport(
+                        total_sales=total_sales,
+                        total_orders=total_orders,
+                        cancelled_orders=cancelled_orders,
+                        products_sold=self.valid_products_sold,
+                        revenue_by_category=self.valid_revenue_by_category,
+                        top_customers=self.valid_top_customers
+                    )
 
     def test_immutability_defensive_copies(self) -> None:
         """Test that returned collections are defensive copies."""
-        original_products = {1: 5, 2: 3}
-        original_revenue = {"Electronics": 800.0}
-        original_customers = [(101, 500.0)]
-        
+        # Fresh instance so a broken copy cannot leak into the shared report
         report = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold=original_products,
-            revenue_by_category=original_revenue,
-            top_customers=original_customers
+            total_sales=self.valid_total_sales,
+            total_orders=self.valid_total_orders,
+            cancelled_orders=self.valid_cancelled_orders,
+            products_sold=self.valid_products_sold,
+            revenue_by_category=self.valid_revenue_by_category,
+            top_customers=self.valid_top_customers
         )
         
         # Modify returned collections
@@ -87,26 +89,17 @@ class TestSalesReport(unittest.TestCase):
         customers_copy = report.top_customers
         
         products_copy[3] = 10  # Should not affect original
-        revenue_copy["Books"] = 200.0
+        revenue_copy["Toys"] = 50.0
         customers_copy.append((103, 100.0))
         
         # Verify original data is unchanged
         self.assertEqual(report.products_sold, {1: 5, 2: 3})
-        self.assertEqual(report.revenue_by_category, {"Electronics": 800.0})
-        self.assertEqual(report.top_customers, [(101, 500.0)])
+        self.assertEqual(report.revenue_by_category, {"Electronics": 800.0, "Books": 200.0})
+        self.assertEqual(report.top_customers, [(101, 500.0), (102, 300.0)])
 
     def test_to_dict(self) -> None:
         """Test converting report to dictionary."""
-        report = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={1: 5, 2: 3},
-            revenue_by_category={"Electronics": 800.0, "Books": 200.0},
-            top_customers=[(101, 500.0), (102, 300.0)]
-        )
-        
-        result = report.to_dict()
+        result = self.report.to_dict()
         expected = {
             'total_sales': 1000.0,
             'total_orders': 10,
@@ -120,82 +113,43 @@ class TestSalesReport(unittest.TestCase):
 
     def test_string_representations(self) -> None:
         """Test string representations of report."""
-        report = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={},
-            revenue_by_category={},
-            top_customers=[]
-        )
-        
-        str_repr = str(report)
-        self.assertIn("$1000.00", str_repr)
-        self.assertIn("10 orders", str_repr)
-        self.assertIn("2 cancelled", str_repr)
-        
-        repr_str = repr(report)
-        self.assertIn("SalesReport", repr_str)
-        self.assertIn("total_sales=1000.0", repr_str)
+        self.assertEqual(str(self.report), EXPECTED_STR)
+        self.assertEqual(repr(self.report), EXPECTED_REPR)
 
     def test_equality(self) -> None:
         """Test report equality comparison."""
-        report1 = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={1: 5},
-            revenue_by_category={"Electronics": 800.0},
-            top_customers=[(101, 500.0)]
-        )
-        
-        report2 = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={1: 5},
-            revenue_by_category={"Electronics": 800.0},
-            top_customers=[(101, 500.0)]
-        )
-        
-        self.assertEqual(report1, report2)
+        self.assertEqual(self.report, SalesReport(
+            total_sales=self.valid_total_sales,
+            total_orders=self.valid_total_orders,
+            cancelled_orders=self.valid_cancelled_orders,
+            products_sold=self.valid_products_sold,
+            revenue_by_category=self.valid_revenue_by_category,
+            top_customers=self.valid_top_customers
+        ))
 
     def test_inequality_different_sales(self) -> None:
         """Test report inequality with different total sales."""
-        report1 = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={},
-            revenue_by_category={},
-            top_customers=[]
-        )
-        
-        report2 = SalesReport(
-            total_sales=2000.0,  # Different
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={},
-            revenue_by_category={},
-            top_customers=[]
-        )
-        
-        self.assertNotEqual(report1, report2)
+        self.assertNotEqual(self.report, SalesReport(
+            total_sales=2000.0,
+            total_orders=self.valid_total_orders,
+            cancelled_orders=self.valid_cancelled_orders,
+            products_sold=self.valid_products_sold,
+            revenue_by_category=self.valid_revenue_by_category,
+            top_customers=self.valid_top_customers
+        ))
 
     def test_hash_functionality(self) -> None:
         """Test that reports can be used in sets/dicts."""
-        report = SalesReport(
-            total_sales=1000.0,
-            total_orders=10,
-            cancelled_orders=2,
-            products_sold={1: 5},
-            revenue_by_category={"Electronics": 800.0},
-            top_customers=[(101, 500.0)]
-        )
-        
-        # Should be able to hash (for sets/dicts)
-        report_set = {report}
-        self.assertIn(report, report_set)
+        self.assertIn(self.report, self.report_set)
+        # An equal report built separately must hash to the same bucket
+        self.assertIn(SalesReport(
+            total_sales=self.valid_total_sales,
+            total_orders=self.valid_total_orders,
+            cancelled_orders=self.valid_cancelled_orders,
+            products_sold=self.valid_products_sold,
+            revenue_by_category=self.valid_revenue_by_category,
+            top_customers=self.valid_top_customers
+        ), self.report_set)
 
     def test_empty_report(self) -> None:
         """Test creating empty sales report."""
@@ -1,14 +1,61 @@
 """Test cases for Shipment domain model."""
+from typing import Any, ClassVar
 import unittest
 from domain.models.shipment import Shipment
 from domain.enums.shipment_status import ShipmentStatus
 from domain.enums.shipping_method import ShippingMethod
 from domain.value_objects.address import Address
 
+# Delivery address shared by every shipment built here, validated once
+_ADDRESS = Address("123 Main St")
+
+# (single-field override, expected message pattern) rows Shipment must reject
+_INVALID_SHIPMENT_CASES: tuple[tuple[dict[str, Any], str], ...] = (
+    ({"shipment_id": 0}, "^Shipment ID must be positive$"),
+    ({"order_id": -1}, "^Order ID must be positive$"),
+    ({"tracking_number": ""}, "^Tracking number cannot be empty$"),
+    ({"shipping_method": "invalid_method"}, "is not a valid ShippingMethod"),
+    ({"status": "invalid_status"}, "is not a valid ShipmentStatus"),
+)
+
+# Every field except the ID differs from the _fresh_shipment() defaults
+_SAME_ID_OVERRIDES: dict[str, Any] = {
+    "order_id": 200,
+    "tracking_number": "TRACK67890",
+    "shipping_method": "standard",
+    "address": "456 Oak Ave",
+}
+
+# (overrides to _fresh_shipment(), expected equality with the base shipment)
+_EQUALITY_CASES: tuple[tuple[dict[str, Any], bool], ...] = (
+    (_SAME_ID_OVERRIDES, True),  # Same ID should be equal
+    ({"shipment_id": 2}, False),  # Different ID should not be equal
+)
+
+
+def _fresh_shipment(**overrides: Any) -> Shipment:
+    """Build a new valid shipment; status is left to the constructor default."""
+    fields: dict[str, Any] = {
+        "shipment_id": 1,
+        "order_id": 100,
+        "tracking_number": "TRACK12345",
+        "shipping_method": "express",
+        "address": _ADDRESS,
+        **overrides,
+    }
+    return Shipment(**fields)
+
 
 class TestShipment(unittest.TestCase):
     """Test cases for Shipment domain model."""
 
+    shipment: ClassVar[Shipment]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build one valid shipment shared by read-only tests."""
+        cls.shipment = _fresh_shipment()
+
     def test_shipment_creation_valid(self) -> None:
         """Test creating a valid shipment."""
         shipment = Shipment(
@@ -40,77 +87,21 @@ class TestShipment(unittest.TestCase):
         
         self.assertEqual(shipment.status, ShipmentStatus.PENDING)
 
-    def test_shipment_creation_invalid_id(self) -> None:
-        """Test shipment creation with invalid shipment ID."""
-        with self.assertRaises(ValueError) as context:
-            Shipment(
-                shipment_id=0,
-                order_id=100,
-                tracking_number="TRACK12345",
-                shipping_method="express",
-                address="123 Main St"
-            )
-        
-        self.assertEqual(str(context.exception), "Shipment ID must be positive")
-
-    def test_shipment_creation_invalid_order_id(self) -> None:
-        """Test shipment creation with invalid order ID."""
-        with self.assertRaises(ValueError) as context:
-            Shipment(
-                shipment_id=1,
-                order_id=-1,
-                tracking_number="TRACK12345",
-                shipping_method="express",
-                address="123 Main St"
-            )
-        
-        self.assertEqual(str(context.exception), "Order ID must be positive")
-
-    def test_shipment_creation_empty_tracking_number(self) -> None:
-        """Test shipment creation with empty tracking number."""
-        with self.assertRaises(ValueError) as context:
-            Shipment(
-                shipment_id=1,
-                order_id=100,
-                tracking_number="",
-                shipping_method="express",
-                address="123 Main St"
-            )
-        
-        self.assertEqual(str(context.exception), "Tracking number cannot be empty")
+    def test_shipment_keeps_prebuilt_address(self) -> None:
+        """Test a prebuilt Address is stored as-is rather than re-validated."""
+        self.assertIs(self.shipment.address, _ADDRESS)
 
-    def test_shipment_creation_invalid_shipping_method(self) -> None:
-        """Test shipment creation with invalid shipping method."""
-        with self.assertRaises(ValueError):
-            Shipment(
-                shipment_id=1,
-                order_id=100,
-                tracking_number="TRACK12345",
-                shipping_method="invalid_method",
-                address="123 Main St"
-            )
-
-    def test_shipment_creation_invalid_status(self) -> None:
-        """Test shipment creation with invalid status."""
-        with self.assertRaises(ValueError):
-            Shipment(
-                shipment_id=1,
-                order_id=100,
-                tracking_number="TRACK12345",
-                shipping_method="express",
-                address="123 Main St",
-                status="invalid_status"
-            )
+    def test_shipment_creation_invalid_fields(self) -> None:
+        """Test shipment creation rejects each invalid field."""
+        for overrides, message in _INVALID_SHIPMENT_CASES:
+            with self.subTest(overrides=overrides):
+                with self.assertRaisesRegex(ValueError, message):
+                    _fresh_shipment(**overrides)
 
     def test_shipment_status_setter(self) -> None:
         """Test updating shipment status."""
-        shipment = Shipment(
-            shipment_id=1,
-            order_id=100,
-            tracking_number="TRACK12345",
-            shipping_method="express",
-            address="123 Main St"
-        )
+        # Fresh instance: the setter mutates it
+        shipment = _fresh_shipment()
         
         shipment.status = "in_transit"
         self.assertEqual(shipment.status, ShipmentStatus.IN_TRANSIT)
@@ -120,92 +111,34 @@ class TestShipment(unittest.TestCase):
 
     def test_shipment_status_setter_invalid(self) -> None:
         """Test updating shipment status with invalid value."""
-        shipment = Shipment(
-            shipment_id=1,
-            order_id=100,
-            tracking_number="TRACK12345",
-            shipping_method="express",
-            address="123 Main St"
-        )
+        shipment = _fresh_shipment()
         
         with self.assertRaises(ValueError):
             shipment.status = "invalid_status"
+        self.assertEqual(shipment.status, ShipmentStatus.PENDING)
 
     def test_shipment_string_representation(self) -> None:
         """Test string representation of shipment."""
-        shipment = Shipment(
-            shipment_id=1,
-            order_id=100,
-            tracking_number="TRACK12345",
-            shipping_method="express",
-            address="123 Main St"
-        )
-        
-        self.assertEqual(str(shipment), "Shipment(1: TRACK12345)")
+        self.assertEqual(str(self.shipment), "Shipment(1: TRACK12345)")
 
     def test_shipment_repr(self) -> None:
         """Test repr of shipment."""
-        shipment = Shipment(
-            shipment_id=1,
-            order_id=100,
-            tracking_number="TRACK12345",
-            shipping_method="express",
-            address="123 Main St"
-        )
-        
         expected_repr = "Shipment(id=1, tracking='TRACK12345', status=pending)"
-        self.assertEqual(repr(shipment), expected_repr)
+        self.assertEqual(repr(self.shipment), expected_repr)
 
     def test_shipment_equality(self) -> None:
         """Test shipment equality based on ID."""
-        shipment1 = Shipment(
-            shipment_id=1,
-            order_id=100,
-            tracking_number="TRACK12345",
-            shipping_method="express",
-            address="123 Main St"
-        )
-        
-        shipment2 = Shipment(
-            shipment_id=1,
-            order_id=200,  # Different order ID
-            tracking_number="TRACK67890",  # Different tracking
-            shipping_method="standard",
-            address="456 Oak Ave"
-        )
-        
-        shipment3 = Shipment(
-            shipment_id=2,
-            order_id=100,
-            tracking_number="TRACK12345",
-            shipping_method="express",
-            address="123 Main St"
-        )
-        
-        # Same ID should be equal
-        self.assertEqual(shipment1, shipment2)
-        # Different ID should not be equal
-        self.assertNotEqual(shipment1, shipment3)
+        for overrides, expected_equal in _EQUALITY_CASES:
+            with self.subTest(overrides=overrides):
+                self.assertIs(self.shipment == _fresh_shipment(**overrides), expected_equal)
+
         # Not shipment object should not be equal
-        self.assertNotEqual(shipment1, "not a shipment")
+        self.assertNotEqual(self.shipment, "not a shipment")
 
     def test_shipment_hash(self) -> None:
         """Test shipment hash based on ID."""
-        shipment1 = Shipment(
-            shipment_id=1,
-            order_id=100,
-            tracking_number="TRACK12345",
-            shipping_method="express",
-            address="123 Main St"
-        )
-        
-        shipment2 = Shipment(
-            shipment_id=1,
-            order_id=200,
-            tracking_number="TRACK67890",
-            shipping_method="standard",
-            address="456 Oak Ave"
-        )
+        shipment1 = self.shipment
+        shipment2 = _fresh_shipment(**_SAME_ID_OVERRIDES)
         
         # Same ID should have same hash
         self.assertEqual(hash(shipment1), hash(shipment2))
@@ -216,34 +149,19 @@ class TestShipment(unittest.TestCase):
 
     def test_all_shipping_methods(self) -> None:
         """Test shipment with all shipping methods."""
-        methods = ["standard", "express", "overnight"]
-        
-        for i, method in enumerate(methods, 1):
-            shipment = Shipment(
-                shipment_id=i,
-                order_id=100 + i,
-                tracking_number=f"TRACK{i}",
-                shipping_method=method,
-                address="123 Main St"
-            )
-            
-            self.assertEqual(shipment.shipping_method, ShippingMethod(method))
+        for method in ["standard", "express", "overnight"]:
+            with self.subTest(shipping_method=method):
+                shipment = _fresh_shipment(shipping_method=method)
+                self.assertEqual(shipment.shipping_method, ShippingMethod(method))
 
     def test_all_shipment_statuses(self) -> None:
         """Test shipment with all statuses."""
         statuses = ["pending", "in_transit", "delivered", "cancelled", "returned"]
-        
-        for i, status in enumerate(statuses, 1):
-            shipment = Shipment(
-                shipment_id=i,
-                order_id=100 + i,
-                tracking_number=f"TRACK{i}",
-                shipping_method="standard",
-                address="123 Main St",
-                status=status
-            )
-            
-            self.assertEqual(shipment.status, ShipmentStatus(status))
+
+        for status in statuses:
+            with self.subTest(status=status):
+                shipment = _fresh_shipment(status=status)
+                self.assertEqual(shipment.status, ShipmentStatus(status))
 
 
 if __name__ == '__main__':
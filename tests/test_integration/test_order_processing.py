@@ -5,14 +5,43 @@ Phase 6: Testing refactored system functionality
 """
 import unittest
 import datetime
+from typing import ClassVar, Optional, TypeVar
 from application.order_processor import OrderProcessor
 from domain.models.order_item import OrderItem
 from domain.enums.order_status import OrderStatus
 
+T = TypeVar("T")
+
 
 class TestOrderProcessingIntegration(unittest.TestCase):
     """Integration tests for end-to-end order processing."""
 
+    # Seed rows, shared by every test; each test still gets a fresh OrderProcessor
+    SUPPLIERS = (
+        (1, "Test Supplier 1", "supplier1@test.com", 4.5),
+        (2, "Test Supplier 2", "supplier2@test.com", 4.2),
+    )
+    PRODUCTS = (
+        (1, "Test Laptop", 999.99, 10, "Electronics", 2.5, 1),
+        (2, "Test Mouse", 29.99, 50, "Electronics", 0.2, 2),
+        (3, "Test Keyboard", 79.99, 30, "Electronics", 1.0, 2),
+    )
+    CUSTOMERS = (
+        (101, "Alice Gold", "alice@test.com", "gold", "555-0101", "123 Test St"),
+        (102, "Bob Silver", "bob@test.com", "silver", "555-0102", "456 Test Ave"),
+        (103, "Charlie Standard", "charlie@test.com", "standard", "555-0103", "789 Test Rd"),
+    )
+
+    # Valid card payment; tests override the amount and any failing fields
+    BASE_PAYMENT = {"valid": True, "type": "credit_card", "card_number": "1234567890123456"}
+
+    now: ClassVar[datetime.datetime]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Anchor every date the tests derive to a single reading of the clock."""
+        cls.now = datetime.datetime.now()
+
     def setUp(self) -> None:
         """Set up test environment with OrderProcessor."""
         self.app = OrderProcessor()
@@ -25,24 +54,28 @@ class TestOrderProcessingIntegration(unittest.TestCase):
 
     def _setup_test_suppliers(self) -> None:
         """Set up test suppliers."""
-        self.app.add_supplier(1, "Test Supplier 1", "supplier1@test.com", 4.5)
-        self.app.add_supplier(2, "Test Supplier 2", "supplier2@test.com", 4.2)
+        for supplier in self.SUPPLIERS:
+            self.app.add_supplier(*supplier)
 
     def _setup_test_products(self) -> None:
         """Set up test products."""
-        self.app.add_product(1, "Test Laptop", 999.99, 10, "Electronics", 2.5, 1)
-        self.app.add_product(2, "Test Mouse", 29.99, 50, "Electronics", 0.2, 2)
-        self.app.add_product(3, "Test Keyboard", 79.99, 30, "Electronics", 1.0, 2)
+        for product in self.PRODUCTS:
+            self.app.add_product(*product)
 
     def _setup_test_customers(self) -> None:
         """Set up test customers."""
-        self.app.add_customer(101, "Alice Gold", "alice@test.com", "gold", "555-0101", "123 Test St")
-        self.app.add_customer(102, "Bob Silver", "bob@test.com", "silver", "555-0102", "456 Test Ave")
-        self.app.add_customer(103, "Charlie Standard", "charlie@test.com", "standard", "555-0103", "789 Test Rd")
+        for customer in self.CUSTOMERS:
+            self.app.add_customer(*customer)
+
+    def _require(self, value: Optional[T]) -> T:
+        """Assert value is not None and return it narrowed for type checkers."""
+        self.assertIsNotNone(value)
+        assert value is not None  # Type narrowing for mypy
+        return value
 
     def _setup_test_promotions(self) -> None:
         """Set up test promotions."""
-        future_date = datetime.datetime.now() + datetime.timedelta(days=30)
+        future_date = self.now + datetime.timedelta(days=30)
         self.app.add_promotion(1, "TEST10", 10, 50, future_date, "Electronics")
 
     def test_successful_order_creation_gold_member(self) -> None:
@@ -54,19 +87,12 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         ]
         
         # Payment info
-        payment = {
-            "valid": True,
-            "type": "credit_card",
-            "card_number": "1234567890123456",
-            "amount": 1100
-        }
+        payment = {**self.BASE_PAYMENT, "amount": 1100}
         
         # Process order
-        order = self.app.process_order(101, items, payment, shipping_method='standard')
+        order = self._require(self.app.process_order(101, items, payment, shipping_method='standard'))
         
         # Verify order was created
-        self.assertIsNotNone(order)
-        assert order is not None  # Type narrowing for mypy
         self.assertEqual(order.customer_id, 101)
         self.assertEqual(order.status, OrderStatus.PENDING)
         self.assertGreater(order.total_price.value, 0)
@@ -82,19 +108,12 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         ]
         
         # Payment info
-        payment = {
-            "valid": True,
-            "type": "credit_card", 
-            "card_number": "1234567890123456",
-            "amount": 1000
-        }
+        payment = {**self.BASE_PAYMENT, "amount": 1000}
         
         # Process order with promotion
-        order = self.app.process_order(102, items, payment, promo_code="TEST10")
+        order = self._require(self.app.process_order(102, items, payment, promo_code="TEST10"))
         
         # Verify order was created with discount
-        self.assertIsNotNone(order)
-        assert order is not None  # Type narrowing for mypy
         self.assertEqual(order.customer_id, 102)
         # Order total should be less than full price due to promotion
         self.assertLess(order.total_price.value, 999.99 + 15.00)  # Less than laptop + standard shipping
@@ -107,12 +126,7 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         ]
         
         # Payment info
-        payment = {
-            "valid": True,
-            "type": "credit_card",
-            "card_number": "1234567890123456", 
-            "amount": 20000
-        }
+        payment = {**self.BASE_PAYMENT, "amount": 20000}
         
         # Process order - should fail
         order = self.app.process_order(103, items, payment)
@@ -128,12 +142,7 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         ]
         
         # Invalid payment info
-        payment = {
-            "valid": False,  # Invalid payment
-            "type": "credit_card",
-            "card_number": "invalid",
-            "amount": 30
-        }
+        payment = {**self.BASE_PAYMENT, "valid": False, "card_number": "invalid", "amount": 30}
         
         # Process order - should fail
         order = self.app.process_order(103, items, payment)
@@ -144,7 +153,7 @@ class TestOrderProcessingIntegration(unittest.TestCase):
     def test_order_failure_expired_promotion(self) -> None:
         """Test order with expired promotion code."""
         # Add expired promotion
-        past_date = datetime.datetime.now() - datetime.timedelta(days=1)
+        past_date = self.now - datetime.timedelta(days=1)
         self.app.add_promotion(2, "EXPIRED", 20, 0, past_date, "all")
         
         # Create order items
@@ -153,19 +162,12 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         ]
         
         # Payment info - increase amount for full price without discount
-        payment = {
-            "valid": True,
-            "type": "credit_card",
-            "card_number": "1234567890123456",
-            "amount": 50  # Increased to cover full price + shipping + tax
-        }
+        payment = {**self.BASE_PAYMENT, "amount": 50}  # Increased to cover full price + shipping + tax
         
         # Process order with expired promotion
-        order = self.app.process_order(103, items, payment, promo_code="EXPIRED")
+        order = self._require(self.app.process_order(103, items, payment, promo_code="EXPIRED"))
         
         # Order should be created but without discount
-        self.assertIsNotNone(order)
-        assert order is not None  # Type narrowing for mypy
         # Total should be full price since promotion is expired
         self.assertGreaterEqual(order.total_price.value, 29.99)
 
@@ -173,41 +175,32 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         """Test updating order status after creation."""
         # Create and process order
         items = [OrderItem(2, 1, 29.99)]
-        payment = {"valid": True, "type": "credit_card", "card_number": "1234567890123456", "amount": 35}
-        order = self.app.process_order(101, items, payment)
-        
-        self.assertIsNotNone(order)
-        assert order is not None  # Type narrowing for mypy
+        payment = {**self.BASE_PAYMENT, "amount": 35}
+        order = self._require(self.app.process_order(101, items, payment))
         
         # Update order status
-        updated_order = self.app.update_order_status(order.order_id, 'shipped')
+        updated_order = self._require(self.app.update_order_status(order.order_id, 'shipped'))
         
         # Verify method returns order and status is updated (like legacy system)
-        self.assertIsNotNone(updated_order)
-        assert updated_order is not None  # Type narrowing for mypy
         # Status should be updated to SHIPPED like legacy system
         self.assertEqual(updated_order.status, OrderStatus.SHIPPED)
 
     def test_inventory_deduction_after_order(self) -> None:
         """Test that inventory is properly deducted after order."""
         # Get initial product stock
-        initial_product = self.app.product_service.get_product(2)  # Mouse
-        self.assertIsNotNone(initial_product)
-        assert initial_product is not None  # Type narrowing for mypy
+        initial_product = self._require(self.app.product_service.get_product(2))  # Mouse
         initial_stock = initial_product.quantity_available
         
         # Create order
         items = [OrderItem(2, 3, 29.99)]  # Order 3 mice
-        payment = {"valid": True, "type": "credit_card", "card_number": "1234567890123456", "amount": 100}
+        payment = {**self.BASE_PAYMENT, "amount": 100}
         order = self.app.process_order(101, items, payment)
         
         # Verify order was created
         self.assertIsNotNone(order)
         
         # Check stock after order
-        updated_product = self.app.product_service.get_product(2)
-        self.assertIsNotNone(updated_product)
-        assert updated_product is not None  # Type narrowing for mypy
+        updated_product = self._require(self.app.product_service.get_product(2))
         final_stock = updated_product.quantity_available
         
         # Verify stock was deducted
@@ -228,7 +221,7 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         # Create multiple orders
         items1 = [OrderItem(1, 1, 999.99)]
         items2 = [OrderItem(2, 2, 29.99)]
-        payment = {"valid": True, "type": "credit_card", "card_number": "1234567890123456", "amount": 1100}
+        payment = {**self.BASE_PAYMENT, "amount": 1100}
         
         order1 = self.app.process_order(101, items1, payment)
         order2 = self.app.process_order(102, items2, payment)
@@ -238,8 +231,8 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         self.assertIsNotNone(order2)
         
         # Generate sales report
-        start_date = datetime.datetime.now() - datetime.timedelta(days=1)
-        end_date = datetime.datetime.now() + datetime.timedelta(days=1)
+        start_date = self.now - datetime.timedelta(days=1)
+        end_date = self.now + datetime.timedelta(days=1)
         report = self.app.generate_sales_report(start_date, end_date)
         
         # Verify report contains data
@@ -250,6 +243,23 @@ class TestOrderProcessingIntegration(unittest.TestCase):
         revenue_by_category: dict[str, float] = report.revenue_by_category
         self.assertIn('Electronics', revenue_by_category)
 
+    def test_product_performance_tracks_cancellations(self) -> None:
+        """Test product performance follows order creation and cancellation."""
+        items = [OrderItem(2, 3, 29.99), OrderItem(3, 1, 79.99)]
+        payment = {**self.BASE_PAYMENT, "amount": 200}
+        order = self._require(self.app.process_order(101, items, payment))
+
+        self.assertEqual(self.app.reporting_service.get_product_performance(), {2: 3, 3: 1})
+
+        self.app.order_service.cancel_order(order.order_id, "Customer request")
+
+        self.assertEqual(self.app.reporting_service.get_product_performance(), {})
+
+        # Reinstating the order counts its items again
+        self.app.update_order_status(order.order_id, 'pending')
+
+        self.assertEqual(self.app.reporting_service.get_product_performance(), {2: 3, 3: 1})
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,20 +2,42 @@
 Test CustomerService - with mocked repository dependencies
 Tests customer management, loyalty points, and membership upgrades
 """
+from typing import ClassVar
 import unittest
 from unittest.mock import Mock
 from services.customer_service import CustomerService
 from domain.models.customer import Customer
 from domain.enums.membership_tier import MembershipTier
+from repositories.interfaces.customer_repository import CustomerRepository
 
 
 class TestCustomerService(unittest.TestCase):
     """Test CustomerService with mocked repository dependencies."""
 
+    mock_repository: ClassVar[Mock]
+    customer_service: ClassVar[CustomerService]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the repository mock and the stateless service once."""
+        cls.mock_repository = Mock(spec=CustomerRepository)
+        cls.customer_service = CustomerService(cls.mock_repository)
+
     def setUp(self) -> None:
-        """Set up test dependencies."""
-        self.mock_repository = Mock()
-        self.customer_service = CustomerService(self.mock_repository)
+        """Clear recorded calls and stubbed results left by the previous test."""
+        self.mock_repository.reset_mock(return_value=True, side_effect=True)
+
+    def _customer(self, membership_tier: str = "gold", loyalty_points: int = 100) -> Customer:
+        """Build a fresh John Doe customer; tests mutate it through the service."""
+        return Customer(
+            customer_id=123,
+            name="John Doe",
+            email="john@example.com",
+            membership_tier=membership_tier,
+            phone="555-0123",
+            address="123 Main St",
+            loyalty_points=loyalty_points
+        )
 
     def test_add_customer_success(self) -> None:
         """Test adding a customer successfully."""
@@ -34,15 +56,7 @@ class TestCustomerService(unittest.TestCase):
 
     def test_get_customer_found(self) -> None:
         """Test getting a customer that exists."""
-        expected_customer = Customer(
-            customer_id=123,
-            name="John Doe",
-            email="john@example.com",
-            membership_tier="gold",
-            phone="555-0123",
-            address="123 Main St",
-            loyalty_points=100
-        )
+        expected_customer = self._customer()
         self.mock_repository.get.return_value = expected_customer
         
         result = self.customer_service.get_customer(123)
@@ -61,15 +75,7 @@ class TestCustomerService(unittest.TestCase):
 
     def test_add_loyalty_points_success(self) -> None:
         """Test adding loyalty points to existing customer."""
-        existing_customer = Customer(
-            customer_id=123,
-            name="John Doe",
-            email="john@example.com",
-            membership_tier="gold",
-            phone="555-0123", 
-            address="123 Main St",
-            loyalty_points=100
-        )
+        existing_customer = self._customer()
         self.mock_repository.get.return_value = existing_customer
         
         result = self.customer_service.add_loyalty_points(123, 50)
@@ -78,6 +84,16 @@ class TestCustomerService(unittest.TestCase):
         self.mock_repository.get.assert_called_once_with(123)
         self.mock_repository.update.assert_called_once()
 
+    def test_add_loyalty_points_updates_customer_in_place(self) -> None:
+        """Test loyalty points are applied to the stored customer instance."""
+        existing_customer = self._customer()
+        self.mock_repository.get.return_value = existing_customer
+
+        self.customer_service.add_loyalty_points(123, 50)
+
+        self.assertEqual(existing_customer.loyalty_points, 150)
+        self.mock_repository.update.assert_called_once_with(existing_customer)
+
     def test_add_loyalty_points_customer_not_found(self) -> None:
         """Test adding loyalty points to non-existent customer."""
         self.mock_repository.get.return_value = None
@@ -90,15 +106,7 @@ class TestCustomerService(unittest.TestCase):
 
     def test_upgrade_membership_success(self) -> None:
         """Test upgrading customer membership."""
-        existing_customer = Customer(
-            customer_id=123,
-            name="John Doe",
-            email="john@example.com",
-            membership_tier="silver",
-            phone="555-0123",
-            address="123 Main St",
-            loyalty_points=1000
-        )
+        existing_customer = self._customer(membership_tier="silver", loyalty_points=1000)
         self.mock_repository.get.return_value = existing_customer
         
         result = self.customer_service.upgrade_membership(123, MembershipTier.GOLD)
@@ -119,15 +127,7 @@ class TestCustomerService(unittest.TestCase):
 
     def test_auto_upgrade_membership_qualifies_for_gold(self) -> None:
         """Test automatic membership upgrade for high lifetime value."""
-        existing_customer = Customer(
-            customer_id=123,
-            name="John Doe",
-            email="john@example.com",
-            membership_tier="silver",
-            phone="555-0123",
-            address="123 Main St",
-            loyalty_points=500
-        )
+        existing_customer = self._customer(membership_tier="silver", loyalty_points=500)
         self.mock_repository.get.return_value = existing_customer
         
         # High lifetime value should qualify for gold
@@ -140,15 +140,7 @@ class TestCustomerService(unittest.TestCase):
 
     def test_auto_upgrade_membership_qualifies_for_silver(self) -> None:
         """Test automatic membership upgrade for medium lifetime value."""
-        existing_customer = Customer(
-            customer_id=123,
-            name="John Doe",
-            email="john@example.com",
-            membership_tier="standard",
-            phone="555-0123",
-            address="123 Main St",
-            loyalty_points=200
-        )
+        existing_customer = self._customer(membership_tier="standard", loyalty_points=200)
         self.mock_repository.get.return_value = existing_customer
         
         # Medium lifetime value should qualify for silver
@@ -161,15 +153,7 @@ class TestCustomerService(unittest.TestCase):
 
     def test_auto_upgrade_membership_no_upgrade_needed(self) -> None:
         """Test automatic membership upgrade when no upgrade needed."""
-        existing_customer = Customer(
-            customer_id=123,
-            name="John Doe",
-            email="john@example.com",
-            membership_tier="gold",  # Already gold
-            phone="555-0123",
-            address="123 Main St",
-            loyalty_points=1000
-        )
+        existing_customer = self._customer(loyalty_points=1000)  # Already gold
         self.mock_repository.get.return_value = existing_customer
         
         # Already gold, no upgrade needed
@@ -95,6 +95,27 @@ class TestProductService(unittest.TestCase):
         self.mock_repository.get.assert_called_once_with(1)
         self.mock_repository.update.assert_called_once()
 
+    def test_update_product_price_logs_change(self) -> None:
+        """Test price updates are logged instead of printed."""
+        existing_product = Product(
+            product_id=1,
+            name="Test Product",
+            price=99.99,
+            quantity_available=10,
+            category="Electronics",
+            weight=1.5,
+            supplier_id=1
+        )
+        self.mock_repository.get.return_value = existing_product
+        
+        with self.assertLogs('services.product_service', level='INFO') as logs:
+            self.product_service.update_product_price(1, 199.99)
+        
+        self.assertEqual(
+            logs.output,
+            ["INFO:services.product_service:Updated Test Product price from $99.99 to $199.99"]
+        )
+
     def test_update_product_quantity_success(self) -> None:
         """Test updating a product quantity successfully."""
         # Mock existing product
@@ -3,11 +3,14 @@ Test PromotionService - promotional campaign management
 Tests promotion creation, validation, and usage tracking
 """
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+from services import promotion_service
 from services.promotion_service import PromotionService
 from domain.models.promotion import Promotion
 from domain.enums.product_category import ProductCategory
+from repositories.in_memory.promotion_repository_impl import InMemoryPromotionRepository
 
 
 class TestPromotionService(unittest.TestCase):
@@ -130,13 +133,12 @@ class TestPromotionService(unittest.TestCase):
             category="all"
         )
         
-        self.promotion_repository.get_all.return_value = {
-            "ACTIVE": active_promo,
-            "EXPIRED": expired_promo,
-            "SAVE20": self.promotion
-        }
+        repository = InMemoryPromotionRepository()
+        for promo in (active_promo, expired_promo, self.promotion):
+            repository.add(promo)
+        promotion_service = PromotionService(repository)
         
-        active_promos = self.promotion_service.get_active_promotions()
+        active_promos = promotion_service.get_active_promotions()
         
         self.assertEqual(len(active_promos), 2)  # Only active ones
         active_codes = [promo.code for promo in active_promos]
@@ -157,14 +159,37 @@ class TestPromotionService(unittest.TestCase):
             category="all"
         )
         
-        self.promotion_repository.get_all.return_value = {
-            "EXPIRED": expired_promo
-        }
+        repository = InMemoryPromotionRepository()
+        repository.add(expired_promo)
+        promotion_service = PromotionService(repository)
         
-        active_promos = self.promotion_service.get_active_promotions()
+        active_promos = promotion_service.get_active_promotions()
         
         self.assertEqual(len(active_promos), 0)
 
+    def test_get_active_promotions_after_update(self) -> None:
+        """Test active promotions reflect a replaced expiration date."""
+        repository = InMemoryPromotionRepository()
+        repository.add(self.promotion)
+        promotion_service = PromotionService(repository)
+
+        expired_replacement = Promotion(
+            promo_id=1,
+            code="SAVE20",
+            discount_percent=20.0,
+            min_purchase=100.0,
+            valid_until=datetime.now() - timedelta(days=1),
+            category="all"
+        )
+        repository.update(expired_replacement)
+
+        self.assertEqual(promotion_service.get_active_promotions(), [])
+
+        repository.delete("SAVE20")
+        repository.add(self.promotion)
+
+        self.assertEqual(promotion_service.get_active_promotions(), [self.promotion])
+
     def test_get_all_promotions(self) -> None:
         """Test getting all promotions."""
         mock_promotions = {
@@ -198,6 +223,24 @@ class TestPromotionService(unittest.TestCase):
         
         self.assertIsNone(result)
 
+    def test_get_promotion_reuses_clock_within_ttl(self) -> None:
+        """Test the wall clock is read once per CLOCK_TTL window."""
+        monotonic_clock = Mock(spec=["monotonic"])
+        monotonic_clock.monotonic.side_effect = [100.0, 100.1, 101.0]
+        wall_clock = Mock(spec=["now"])
+        wall_clock.now.return_value = datetime.now()
+        self.promotion_repository.get.return_value = self.promotion
+
+        # Swap only the service module's own time/datetime bindings
+        with patch.object(promotion_service, "time", monotonic_clock), \
+                patch.object(promotion_service, "datetime", SimpleNamespace(datetime=wall_clock)):
+            for _ in range(3):
+                self.assertEqual(self.promotion_service.get_promotion("SAVE20"), self.promotion)
+
+        # Second call falls inside the TTL, third one refreshes
+        self.assertEqual(monotonic_clock.monotonic.call_count, 3)
+        self.assertEqual(wall_clock.now.call_count, 2)
+
     def test_multiple_usage_increments(self) -> None:
         """Test incrementing usage multiple times."""
         self.promotion_repository.get.return_value = self.promotion
@@ -2,8 +2,15 @@
 import unittest
 from unittest.mock import Mock
 from datetime import datetime, timedelta
+from services.customer_service import CustomerService
+from services.order_service import OrderService
 from services.reporting_service import ReportingService
 from domain.enums.order_status import OrderStatus
+from domain.models.customer import Customer
+from domain.models.order import Order
+from domain.models.order_item import OrderItem
+from repositories.in_memory.customer_repository_impl import InMemoryCustomerRepository
+from repositories.in_memory.order_repository_impl import InMemoryOrderRepository
 
 
 class TestReportingService(unittest.TestCase):
@@ -25,7 +32,7 @@ class TestReportingService(unittest.TestCase):
         """Test customer lifetime value calculation with orders."""
         # Create customer with order history
         customer = Mock()
-        customer.order_history = ['order_001', 'order_002', 'order_003']
+        customer.order_history = [1, 2, 3]
         self.customer_service.get_customer.return_value = customer
         
         # Create orders with proper Money value structure
@@ -44,12 +51,8 @@ class TestReportingService(unittest.TestCase):
         order3.total_price.value = 50.0
         order3.status = OrderStatus.CANCELLED
         
-        # Mock get_all_orders to return dictionary of orders
-        self.order_service.get_all_orders.return_value = {
-            'order_001': order1,
-            'order_002': order2,
-            'order_003': order3
-        }
+        orders = {1: order1, 2: order2, 3: order3}
+        self.order_service.get_order.side_effect = orders.get
         
         # Test
         ltv = self.reporting_service.get_customer_lifetime_value(101)
@@ -58,6 +61,56 @@ class TestReportingService(unittest.TestCase):
         self.assertEqual(ltv, 300.0)
         self.customer_service.get_customer.assert_called_once_with(101)
 
+    def test_get_customer_lifetime_value_cached_until_orders_change(self) -> None:
+        """Test LTV is reused until the order service version changes."""
+        customer = Mock()
+        customer.order_history = [1]
+        self.customer_service.get_customer.return_value = customer
+        
+        order = Mock()
+        order.total_price.value = 100.0
+        order.status = OrderStatus.DELIVERED
+        self.order_service.get_order.return_value = order
+        self.order_service.version = 1
+        
+        self.assertEqual(self.reporting_service.get_customer_lifetime_value(101), 100.0)
+        order.total_price.value = 250.0
+        self.assertEqual(self.reporting_service.get_customer_lifetime_value(101), 100.0)
+        self.order_service.get_order.assert_called_once_with(1)
+        
+        self.order_service.version = 2
+        
+        self.assertEqual(self.reporting_service.get_customer_lifetime_value(101), 250.0)
+        self.assertEqual(self.order_service.get_order.call_count, 2)
+
+    def test_get_customer_lifetime_value_follows_order_history(self) -> None:
+        """Test LTV picks up orders added outside OrderService's write paths."""
+        customer_repository = InMemoryCustomerRepository()
+        customer_repository.add(Customer(
+            101, "Alice Gold", "alice@test.com", "gold", "555-0101", "123 Test St", 0))
+        customer_service = CustomerService(customer_repository)
+        order_repository = InMemoryOrderRepository()
+        order_repository.add(self._order(1, OrderStatus.DELIVERED, [OrderItem(1, 1, 100.0)]))
+        customer_service.add_order_to_history(101, 1)
+        order_service = OrderService(
+            order_repository, Mock(), customer_service, Mock(), Mock(),
+            Mock(), Mock(), Mock(), Mock(), Mock()
+        )
+        reporting_service = ReportingService(
+            customer_service=customer_service,
+            order_service=order_service,
+            product_service=self.product_service
+        )
+        
+        self.assertEqual(reporting_service.get_customer_lifetime_value(101), 100.0)
+        
+        # Written straight to the repository, so the order service version
+        # does not change; only the customer's history does
+        order_repository.add(self._order(2, OrderStatus.SHIPPED, [OrderItem(1, 1, 100.0)]))
+        customer_service.add_order_to_history(101, 2)
+        
+        self.assertEqual(reporting_service.get_customer_lifetime_value(101), 200.0)
+
     def test_get_customer_lifetime_value_customer_not_found(self) -> None:
         """Test LTV calculation when customer not found."""
         self.customer_service.get_customer.return_value = None
@@ -99,10 +152,10 @@ class TestReportingService(unittest.TestCase):
         order2.items = []
         
         # Mock services
-        self.order_service.get_all_orders.return_value = {
-            'order1': order1,
-            'order2': order2
-        }
+        self.order_service.iter_orders.return_value = [
+            order1,
+            order2
+        ]
         self.product_service.get_all_products.return_value = {}
         self.customer_service.get_all_customers.return_value = {}
         
@@ -133,10 +186,10 @@ class TestReportingService(unittest.TestCase):
         order2.items = []
         
         # Mock services
-        self.order_service.get_all_orders.return_value = {
-            "1": order1,
-            "2": order2
-        }
+        self.order_service.iter_orders.return_value = [
+            order1,
+            order2
+        ]
         self.product_service.get_all_products.return_value = {}
         self.customer_service.get_all_customers.return_value = {}
         
@@ -161,7 +214,7 @@ class TestReportingService(unittest.TestCase):
         self.customer_service.get_all_customers.return_value = {}
         self.product_service.get_all_products.return_value = {}
         
-        self.order_service.get_all_orders.return_value = {"1": order1}
+        self.order_service.iter_orders.return_value = [order1]
         
         report = self.reporting_service.generate_sales_report(start_date, end_date)
         
@@ -169,76 +222,61 @@ class TestReportingService(unittest.TestCase):
         self.assertEqual(report.total_orders, 0)
         self.assertEqual(report.cancelled_orders, 0)
 
+    def _reporting_service_with_orders(self, *orders: Order) -> ReportingService:
+        """Build a reporting service over a real order service and repository."""
+        order_repository = InMemoryOrderRepository()
+        for order in orders:
+            order_repository.add(order)
+        order_service = OrderService(
+            order_repository, Mock(), Mock(), Mock(), Mock(),
+            Mock(), Mock(), Mock(), Mock(), Mock()
+        )
+        return ReportingService(
+            customer_service=self.customer_service,
+            order_service=order_service,
+            product_service=self.product_service
+        )
+
+    def _order(self, order_id: int, status: OrderStatus, items: list[OrderItem]) -> Order:
+        """Build an order with the given status and items."""
+        return Order(
+            order_id=order_id,
+            customer_id=101,
+            items=items,
+            status=status,
+            created_at=datetime.now(),
+            total_price=100.0,
+            shipping_cost=5.0
+        )
+
     def test_get_product_performance_with_orders(self) -> None:
         """Test product performance calculation with multiple orders."""
-        # Create mock order items
-        item1 = Mock()
-        item1.product_id = 1
-        item1.quantity = 5
-        
-        item2 = Mock()
-        item2.product_id = 2
-        item2.quantity = 3
-        
-        item3 = Mock()
-        item3.product_id = 1  # Same product as item1
-        item3.quantity = 2
-        
-        item4 = Mock()
-        item4.product_id = 3
-        item4.quantity = 1
-        
-        # Create orders with different statuses
-        order1 = Mock()
-        order1.status = OrderStatus.DELIVERED
-        order1.items = [item1, item2]
-        
-        order2 = Mock()
-        order2.status = OrderStatus.SHIPPED
-        order2.items = [item3]
-        
-        order3 = Mock()
-        order3.status = OrderStatus.CANCELLED  # Should be ignored
-        order3.items = [item4]
-        
-        self.order_service.get_all_orders.return_value = {
-            'order1': order1,
-            'order2': order2,
-            'order3': order3
-        }
+        reporting_service = self._reporting_service_with_orders(
+            self._order(1, OrderStatus.DELIVERED, [OrderItem(1, 5, 10.0), OrderItem(2, 3, 10.0)]),
+            self._order(2, OrderStatus.SHIPPED, [OrderItem(1, 2, 10.0)]),
+            self._order(3, OrderStatus.CANCELLED, [OrderItem(3, 1, 10.0)])  # Should be ignored
+        )
         
-        performance = self.reporting_service.get_product_performance()
+        performance = reporting_service.get_product_performance()
         
-        # Product 1: 5 + 2 = 7 (item4 ignored because order cancelled)
+        # Product 1: 5 + 2 = 7
         # Product 2: 3
         # Product 3: not included (cancelled order)
-        expected = {
-            1: 7,
-            2: 3
-        }
-        self.assertEqual(performance, expected)
-
-    def test_get_product_performance_empty_orders(self) -> None:
-        """Test product performance with no orders."""
-        self.order_service.get_all_orders.return_value = {}
-        
-        performance = self.reporting_service.get_product_performance()
-        
-        self.assertEqual(performance, {})
+        self.assertEqual(performance, {1: 7, 2: 3})
 
     def test_get_product_performance_all_cancelled_orders(self) -> None:
         """Test product performance with all cancelled orders."""
-        item1 = Mock()
-        item1.product_id = 1
-        item1.quantity = 5
+        reporting_service = self._reporting_service_with_orders(
+            self._order(1, OrderStatus.CANCELLED, [OrderItem(1, 5, 10.0)])
+        )
         
-        order1 = Mock()
-        order1.status = OrderStatus.CANCELLED
-        order1.items = [item1]
+        performance = reporting_service.get_product_performance()
         
-        self.order_service.get_all_orders.return_value = {
-            'order1': order1
-        }
+        self.assertEqual(performance, {})
+
+    def test_get_product_performance_empty_orders(self) -> None:
+        """Test product performance with no orders."""
+        self.order_service.get_quantities_sold.return_value = {}
         
         performance = self.reporting_service.get_product_performance()
         
@@ -278,21 +316,23 @@ class TestReportingService(unittest.TestCase):
         # Create orders
         order1 = Mock()
         order1.status = OrderStatus.DELIVERED
+        order1.total_price.value = 100.0
         order1.items = [item1, item2]
         
         order2 = Mock()
         order2.status = OrderStatus.SHIPPED
+        order2.total_price.value = 100.0
         order2.items = [item3]
         
         order3 = Mock()
         order3.status = OrderStatus.CANCELLED  # Should be ignored
         order3.items = [item1]  # Same item as in order1
         
-        self.order_service.get_all_orders.return_value = {
-            'order1': order1,
-            'order2': order2,
-            'order3': order3
-        }
+        self.order_service.iter_orders.return_value = [
+            order1,
+            order2,
+            order3
+        ]
         
         self.product_service.get_all_products.return_value = {
             1: product1,
@@ -313,7 +353,7 @@ class TestReportingService(unittest.TestCase):
 
     def test_get_category_revenue_empty_orders(self) -> None:
         """Test category revenue with no orders."""
-        self.order_service.get_all_orders.return_value = {}
+        self.order_service.iter_orders.return_value = []
         self.product_service.get_all_products.return_value = {}
         
         revenue = self.reporting_service.get_category_revenue()
@@ -330,11 +370,10 @@ class TestReportingService(unittest.TestCase):
         
         order1 = Mock()
         order1.status = OrderStatus.DELIVERED
+        order1.total_price.value = 100.0
         order1.items = [item1]
         
-        self.order_service.get_all_orders.return_value = {
-            'order1': order1
-        }
+        self.order_service.iter_orders.return_value = [order1]
         
         # Product not in catalog
         self.product_service.get_all_products.return_value = {}
@@ -359,9 +398,7 @@ class TestReportingService(unittest.TestCase):
         order1.status = OrderStatus.CANCELLED
         order1.items = [item1]
         
-        self.order_service.get_all_orders.return_value = {
-            'order1': order1
-        }
+        self.order_service.iter_orders.return_value = [order1]
         
         self.product_service.get_all_products.return_value = {
             1: product1
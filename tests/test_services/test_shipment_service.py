@@ -5,6 +5,7 @@ from services.shipment_service import ShipmentService
 from domain.enums.shipping_method import ShippingMethod
 from domain.enums.shipment_status import ShipmentStatus
 from domain.models.shipment import Shipment
+from repositories.in_memory.shipment_repository_impl import InMemoryShipmentRepository
 
 
 class TestShipmentService(unittest.TestCase):
@@ -36,6 +37,19 @@ class TestShipmentService(unittest.TestCase):
         self.assertEqual(call_args.address.value, "123 Main St")
         self.assertEqual(call_args.status, ShipmentStatus.PENDING)
 
+    def test_create_shipment_unique_tracking_numbers(self) -> None:
+        """Test repeated shipments for one order get distinct tracking numbers."""
+        tracking_numbers = {
+            self.shipment_service.create_shipment(
+                order_id=123,
+                shipping_method=ShippingMethod.STANDARD,
+                address="123 Main St"
+            )
+            for _ in range(100)
+        }
+
+        self.assertEqual(len(tracking_numbers), 100)
+
     def test_update_shipment_status_success(self) -> None:
         """Test updating shipment status successfully."""
         mock_shipment = Mock(spec=Shipment)
@@ -158,6 +172,27 @@ class TestShipmentService(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(mock_shipment.status, ShipmentStatus.DELIVERED.value)
 
+    def test_tracking_lookup_with_in_memory_repository(self) -> None:
+        """Test tracking number lookups against the indexed repository."""
+        repository = InMemoryShipmentRepository()
+        shipment_service = ShipmentService(repository)
+        
+        tracking = shipment_service.ship_order(
+            order_id=42,
+            shipping_method=ShippingMethod.STANDARD,
+            address="123 Main St"
+        )
+        
+        shipment = shipment_service.get_tracking_info(tracking)
+        assert shipment is not None  # Type narrowing for mypy
+        self.assertEqual(shipment.order_id, 42)
+        self.assertEqual(shipment.status, ShipmentStatus.IN_TRANSIT)
+        
+        repository.delete(shipment.shipment_id)
+        
+        self.assertIsNone(shipment_service.get_tracking_info(tracking))
+        self.assertFalse(shipment_service.mark_delivered(tracking))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
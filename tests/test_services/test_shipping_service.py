@@ -112,6 +112,31 @@ class TestShippingService(unittest.TestCase):
         # Standard at $50: free shipping
         self.assertEqual(cost, 0.0)
 
+    def test_calculate_shipping_cost_batch_matches_scalar(self) -> None:
+        """Test batch shipping costs match per-order calculation."""
+        methods = [ShippingMethod.EXPRESS, ShippingMethod.STANDARD,
+                   ShippingMethod.STANDARD, ShippingMethod.OVERNIGHT]
+        weights = [2.0, 1.0, 2.0, 3.0]
+        subtotals = [100.0, 30.0, 75.0, 200.0]
+        tiers = [MembershipTier.GOLD, MembershipTier.STANDARD,
+                 MembershipTier.BRONZE, MembershipTier.SILVER]
+
+        costs = self.shipping_service.calculate_shipping_cost_batch(
+            methods, weights, subtotals, tiers)
+
+        expected = [
+            self.shipping_service.calculate_shipping_cost(*args)
+            for args in zip(methods, weights, subtotals, tiers)
+        ]
+        self.assertEqual(costs, expected)
+        self.assertEqual(costs, [13.0, 5.2, 0.0, 53.0])
+
+    def test_calculate_shipping_cost_batch_length_mismatch(self) -> None:
+        """Test batch shipping cost rejects sequences of different lengths."""
+        with self.assertRaises(ValueError):
+            self.shipping_service.calculate_shipping_cost_batch(
+                [ShippingMethod.STANDARD], [1.0, 2.0], [10.0], [MembershipTier.GOLD])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
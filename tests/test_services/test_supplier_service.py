@@ -2,10 +2,13 @@
 Test SupplierService - supplier management functionality
 Tests supplier creation, reliability tracking, and notifications
 """
+import io
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import Mock
 from services.supplier_service import SupplierService
 from domain.models.supplier import Supplier
+from repositories.in_memory.supplier_repository_impl import InMemorySupplierRepository
 
 
 class TestSupplierService(unittest.TestCase):
@@ -24,6 +27,13 @@ class TestSupplierService(unittest.TestCase):
             reliability_score=0.85
         )
 
+    def _service_with_suppliers(self, *suppliers: Supplier) -> SupplierService:
+        """Build a service over an in-memory repository holding suppliers."""
+        repository = InMemorySupplierRepository()
+        for supplier in suppliers:
+            repository.add(supplier)
+        return SupplierService(repository)
+
     def test_add_supplier(self) -> None:
         """Test adding a new supplier."""
         result = self.supplier_service.add_supplier(
@@ -74,13 +84,9 @@ class TestSupplierService(unittest.TestCase):
             reliability_score=0.5
         )
         
-        self.supplier_repository.get_all.return_value = {
-            2: reliable_supplier,
-            3: unreliable_supplier,
-            1: self.supplier  # 0.85 reliability
-        }
+        supplier_service = self._service_with_suppliers(reliable_supplier, unreliable_supplier, self.supplier)
         
-        result = self.supplier_service.get_reliable_suppliers()
+        result = supplier_service.get_reliable_suppliers()
         
         self.assertEqual(len(result), 2)  # Only suppliers with >= 0.7 reliability
         supplier_ids = [s.supplier_id for s in result]
@@ -104,14 +110,10 @@ class TestSupplierService(unittest.TestCase):
             reliability_score=0.8
         )
         
-        self.supplier_repository.get_all.return_value = {
-            4: supplier1,
-            5: supplier2,
-            1: self.supplier  # 0.85 reliability
-        }
+        supplier_service = self._service_with_suppliers(supplier1, supplier2, self.supplier)
         
         # Test with threshold of 0.75
-        result = self.supplier_service.get_reliable_suppliers(0.75)
+        result = supplier_service.get_reliable_suppliers(0.75)
         
         self.assertEqual(len(result), 2)  # Only suppliers with >= 0.75 reliability
         supplier_ids = [s.supplier_id for s in result]
@@ -128,14 +130,22 @@ class TestSupplierService(unittest.TestCase):
             reliability_score=0.3
         )
         
-        self.supplier_repository.get_all.return_value = {
-            6: unreliable_supplier
-        }
+        supplier_service = self._service_with_suppliers(unreliable_supplier)
         
-        result = self.supplier_service.get_reliable_suppliers(0.8)
+        result = supplier_service.get_reliable_suppliers(0.8)
         
         self.assertEqual(len(result), 0)
 
+    def test_get_reliable_suppliers_after_reliability_update(self) -> None:
+        """Test reliability threshold queries follow score updates."""
+        supplier_service = self._service_with_suppliers(self.supplier)
+        
+        supplier_service.update_supplier_reliability(1, 0.5)
+        self.assertEqual(supplier_service.get_reliable_suppliers(), [])
+        
+        supplier_service.update_supplier_reliability(1, 0.9)
+        self.assertEqual(supplier_service.get_reliable_suppliers(), [self.supplier])
+
     def test_update_reliability_success(self) -> None:
         """Test successful reliability update."""
         self.supplier_repository.get.return_value = self.supplier
@@ -161,7 +171,20 @@ class TestSupplierService(unittest.TestCase):
         self.supplier_repository.update.assert_not_called()
 
     def test_get_all_suppliers(self) -> None:
-        """Test getting all suppliers."""
+        """Test getting all suppliers as a read-only live view."""
+        supplier_service = self._service_with_suppliers(self.supplier)
+        
+        result = supplier_service.get_all_suppliers()
+        
+        self.assertEqual(dict(result), {1: self.supplier})
+        with self.assertRaises(TypeError):
+            result[2] = self.supplier  # type: ignore[index]
+        
+        supplier_service.add_supplier(2, "New Supplier", "new@supplier.com", 0.75)
+        self.assertIn(2, result)
+
+    def test_snapshot_suppliers(self) -> None:
+        """Test snapshots are independent copies."""
         mock_suppliers = {
             1: self.supplier,
             2: Mock()
@@ -169,7 +192,7 @@ class TestSupplierService(unittest.TestCase):
         
         self.supplier_repository.get_all.return_value = mock_suppliers
         
-        result = self.supplier_service.get_all_suppliers()
+        result = self.supplier_service.snapshot_suppliers()
         
         self.assertEqual(result, mock_suppliers)
         self.supplier_repository.get_all.assert_called_once()
@@ -185,6 +208,56 @@ class TestSupplierService(unittest.TestCase):
         self.assertTrue(result)
         self.supplier_repository.get.assert_called_once_with(1)
 
+    def test_notify_reorder_message(self) -> None:
+        """Test reorder notification message format."""
+        self.supplier_repository.get.return_value = self.supplier
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.supplier_service.notify_reorder("Test Product", 1, 5)
+        
+        self.assertEqual(
+            output.getvalue(),
+            "[EMAIL to supplier@test.com] Low stock alert for Test Product. "
+            "Current stock: 5. Please prepare reorder.\n"
+        )
+
+    def test_notify_reorders_batches_messages(self) -> None:
+        """Test batch reorder notifications match the single-item format."""
+        other = Supplier(
+            supplier_id=2,
+            name="Other Supplier",
+            email="other@test.com",
+            reliability_score=0.5
+        )
+        service = self._service_with_suppliers(self.supplier, other)
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            sent = service.notify_reorders([
+                ("Widget", 1, 3),
+                ("Missing", 999, 1),
+                ("Gadget", 2, 0),
+            ])
+        
+        self.assertEqual(sent, 2)
+        self.assertEqual(
+            output.getvalue(),
+            "[EMAIL to supplier@test.com] Low stock alert for Widget. "
+            "Current stock: 3. Please prepare reorder.\n"
+            "[EMAIL to other@test.com] Low stock alert for Gadget. "
+            "Current stock: 0. Please prepare reorder.\n"
+        )
+
+    def test_notify_reorders_empty(self) -> None:
+        """Test batch reorder notifications with nothing to send."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            sent = self.supplier_service.notify_reorders([])
+        
+        self.assertEqual(sent, 0)
+        self.assertEqual(output.getvalue(), "")
+
     def test_notify_reorder_supplier_not_found(self) -> None:
         """Test reorder notification for non-existent supplier."""
         self.supplier_repository.get.return_value = None
@@ -218,11 +291,9 @@ class TestSupplierService(unittest.TestCase):
             reliability_score=0.7  # Exactly at default threshold
         )
         
-        self.supplier_repository.get_all.return_value = {
-            7: exact_threshold_supplier
-        }
+        supplier_service = self._service_with_suppliers(exact_threshold_supplier)
         
-        result = self.supplier_service.get_reliable_suppliers()
+        result = supplier_service.get_reliable_suppliers()
         
         self.assertEqual(len(result), 1)  # Should include supplier with exact threshold
 